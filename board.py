@@ -5,10 +5,72 @@ import pygame
 import math
 from typing import List, Tuple, Dict, Optional
 
+# Placeholder in precomputed move candidates for the player's previous node
+_PREVIOUS_NODE = object()
+
+# Number of segments in a piece animation path (the path has one more point)
+_ANIMATION_PATH_POINTS = 20
+
+# Sine wave of a snake piece's squiggle, one value per point of its 10 segments
+_SQUIGGLE_WAVE = [math.sin(i * math.pi / 2) for i in range(11)]
+
+def _arc_path(center_x: float, center_y: float, radius: float,
+              start_angle: float, rotation_angle: float, num_points: int) -> List[Tuple[float, float]]:
+    """
+    Sample points along an arc of a circle.
+    
+    Args:
+        center_x: X coordinate of the circle's center
+        center_y: Y coordinate of the circle's center
+        radius: Radius of the circle
+        start_angle: Angle of the first point in radians
+        rotation_angle: Angle swept by the arc in radians
+        num_points: Number of segments; num_points + 1 points are returned
+        
+    Returns:
+        List of (x, y) points from the start to the end of the arc
+    """
+    # Interpolate the angles, then place every point on the circle
+    angle_step = rotation_angle / num_points
+    angles = [start_angle + angle_step * i for i in range(num_points + 1)]
+    cos, sin = math.cos, math.sin
+    return [(center_x + radius * cos(angle), center_y + radius * sin(angle)) for angle in angles]
+
+def _line_path(start_x: float, start_y: float, end_x: float, end_y: float,
+               num_points: int) -> List[Tuple[float, float]]:
+    """
+    Sample points along a straight line.
+    
+    Args:
+        start_x: X coordinate of the start point
+        start_y: Y coordinate of the start point
+        end_x: X coordinate of the end point
+        end_y: Y coordinate of the end point
+        num_points: Number of segments; num_points + 1 points are returned
+        
+    Returns:
+        List of (x, y) points from the start to the end of the line
+    """
+    # Interpolate positions along the line's direction vector
+    dx = end_x - start_x
+    dy = end_y - start_y
+    inv_num_points = 1.0 / num_points
+    fractions = [i * inv_num_points for i in range(num_points + 1)]
+    return [(start_x + dx * t, start_y + dy * t) for t in fractions]
+
 class BoardNode:
     """
     Represents a single node on the game board.
+    
+    Nodes are created once by the Board and never copied, so every position on
+    the board has exactly one canonical BoardNode object. Equality and hashing
+    are therefore identity based: compare nodes with ``is`` rather than by
+    their coordinates.
     """
+    # Fixed attribute layout: no per-node __dict__ and faster attribute reads
+    __slots__ = ('x', 'y', 'circle_idx', 'node_idx', 'index',
+                 'is_snake', 'is_fox', 'snake_target', 'fox_target', '_position')
+    
     def __init__(self, x: int, y: int, circle_idx: int, node_idx: int):
         """
         Initialize a board node.
@@ -21,42 +83,18 @@ class BoardNode:
         """
         self.x = x
         self.y = y
+        self._position = (x, y)  # Nodes never move, so the tuple is built once
         self.circle_idx = circle_idx
         self.node_idx = node_idx
+        self.index = -1  # Position in the board's flat node list (set by the Board)
         self.is_snake = False
         self.is_fox = False
         self.snake_target = None
         self.fox_target = None
     
-    def __eq__(self, other):
-        """
-        Check if two nodes are equal based on their coordinates and indices.
-        
-        Args:
-            other: The other node to compare with
-            
-        Returns:
-            True if the nodes have the same coordinates and indices, False otherwise
-        """
-        if not isinstance(other, BoardNode):
-            return False
-        return (self.x == other.x and 
-                self.y == other.y and 
-                self.circle_idx == other.circle_idx and 
-                self.node_idx == other.node_idx)
-    
-    def __hash__(self):
-        """
-        Generate a hash value for the node based on its coordinates and indices.
-        
-        Returns:
-            A hash value for the node
-        """
-        return hash((self.x, self.y, self.circle_idx, self.node_idx))
-        
     def get_position(self) -> Tuple[int, int]:
         """Get the screen coordinates of this node."""
-        return (self.x, self.y)
+        return self._position
 
 class Board:
     """
@@ -66,12 +104,42 @@ class Board:
     It also contains fox pieces that can move and capture player pieces.
     """
     
-    # List of player pieces on the board (will be set by the Game class)
-    player_pieces = []
+    def _get_occupancy(self) -> Tuple[int, int]:
+        """
+        Get the occupancy bitmasks, rebuilding them if the pieces changed.
+        
+        Pieces move far less often than occupancy is queried, so the masks are
+        kept between queries and rebuilt only when the piece lists differ from
+        copies taken when they were built. Comparing contents rather than
+        tracking assignments means lists edited in place are picked up too.
+        The comparison runs once per public query; movement queries hand the
+        masks on to their search instead of checking again for every node.
+        Rebuilding also drops the cached movement queries, which are only
+        valid for the occupancy they were computed with.
+        
+        Returns:
+            Tuple of (player mask, enemy mask). Bit i is set when the node with
+            flat index i holds a player, or a fox or snake respectively.
+        """
+        # Lists of nodes compare element by element by identity, without
+        # building anything, so an unchanged board costs one comparison
+        pieces = (self.player_pieces, self.fox_pieces, self.snake_pieces)
+        if self._occupancy is None or pieces != self._occupancy_pieces:
+            self._move_cache.clear()
+            self._occupancy = (self._pieces_mask(self.player_pieces),
+                               self._pieces_mask(self.fox_pieces) | self._pieces_mask(self.snake_pieces))
+            self._occupancy_pieces = (list(self.player_pieces), list(self.fox_pieces), list(self.snake_pieces))
+        return self._occupancy
     
-    # Animation properties for fox and snake pieces
-    fox_animations = {}  # Dictionary mapping fox node to animation data
-    snake_animations = {}  # Dictionary mapping snake node to animation data
+    @staticmethod
+    def _pieces_mask(pieces: List[BoardNode]) -> int:
+        """Pack the flat indices of the given piece nodes into a bitmask."""
+        mask = 0
+        for node in pieces:
+            # Nodes that don't belong to the board occupy no board position
+            if node.index >= 0:
+                mask |= 1 << node.index
+        return mask
     
     def is_node_occupied(self, node: BoardNode, current_player_node: Optional[BoardNode] = None) -> bool:
         """
@@ -84,40 +152,38 @@ class Board:
         Returns:
             True if the node is occupied, False otherwise
         """
-        # Center node is special - allows multiple players but not if a fox or snake is there
-        if node == self.center_node:
-            # Check if center node is occupied by a fox or snake piece
-            for fox_node in self.fox_pieces:
-                if fox_node.x == node.x and fox_node.y == node.y:
-                    return True
-            
-            for snake_node in self.snake_pieces:
-                if snake_node.x == node.x and snake_node.y == node.y:
-                    return True
+        player_mask, enemy_mask = self._get_occupancy()
+        return self._is_occupied_in(node, current_player_node, player_mask, enemy_mask)
+    
+    def _is_occupied_in(self, node: BoardNode, current_player_node: Optional[BoardNode],
+                        player_mask: int, enemy_mask: int) -> bool:
+        """
+        Check if a node is occupied according to already fetched occupancy masks.
+        
+        Args:
+            node: The node to check
+            current_player_node: The current player's node (to allow capture)
+            player_mask: Bitmask of the nodes holding a player
+            enemy_mask: Bitmask of the nodes holding a fox or snake
             
-            # Center node is not occupied by a fox or snake, so it's available
+        Returns:
+            True if the node is occupied, False otherwise
+        """
+        # Nodes that don't belong to the board are never occupied
+        if node.index < 0:
+            return False
+        bit = 1 << node.index
+        
+        # Most nodes are empty
+        if not (player_mask | enemy_mask) & bit:
             return False
         
-        # Check if node is occupied by a fox piece
-        if node in self.fox_pieces:
-            # If this is the current player's node, allow capture
-            return current_player_node != node
-        
-        # Check if node is occupied by a snake piece
-        if node in self.snake_pieces:
-            # If this is the current player's node, allow capture
-            return current_player_node != node
-        
-        # Check if node is occupied by a player piece
-        for player_node in self.player_pieces:
-            if node.x == player_node.x and node.y == player_node.y:
-                # If this is the current player's node, allow movement
-                if current_player_node and node.x == current_player_node.x and node.y == current_player_node.y:
-                    return False
-                return True
-        
-        # Node is not occupied
-        return False
+        # Center node is special - allows multiple players but not if a fox or snake is there
+        if node is self.center_node:
+            return bool(enemy_mask & bit)
+        
+        # If this is the current player's node, allow movement or capture
+        return node is not current_player_node
     
     def __init__(self, num_circles: int = 6, nodes_per_circle: int = 10):
         """
@@ -127,6 +193,15 @@ class Board:
             num_circles: Number of concentric circles on the board
             nodes_per_circle: Number of nodes per circle
         """
+        # Player pieces on the board (set by the Game class) and the lazily
+        # built occupancy map of all pieces
+        self.player_pieces = []
+        self._occupancy = None
+        self._occupancy_pieces = None
+        
+        # Cached movement queries for the current occupancy
+        self._move_cache = {}
+        
         # Animation properties
         self.animation_speed = 0.05  # Progress increment per frame
         # Board dimensions and properties
@@ -136,25 +211,57 @@ class Board:
         self.node_radius = 20     # Increased radius of each node
         self.center_node_radius = 40  # Increased radius of the center node
         
+        # Squared node radii, for distance checks without square roots
+        self._node_radius_sq = self.node_radius ** 2
+        self._center_node_radius_sq = self.center_node_radius ** 2
+        
         # Board structure
         self.num_circles = num_circles
         self.nodes_per_circle = nodes_per_circle
         
+        # Radius of every circle, indexed by circle index
+        self._circle_radii = [(circle_idx + 1) * self.circle_spacing for circle_idx in range(num_circles)]
+        
         # Generate the board nodes
         self.nodes = self._generate_board()
         
+        # Flatten the nodes so a (circle_idx, node_idx) pair packs into a single
+        # list index: row offset of the circle plus the wrapped node index
+        self._flat_nodes = []
+        self._row_offset = []
+        self._row_length = []
+        for circle_nodes in self.nodes:
+            self._row_offset.append(len(self._flat_nodes))
+            self._row_length.append(len(circle_nodes))
+            self._flat_nodes.extend(circle_nodes)
+        for index, node in enumerate(self._flat_nodes):
+            node.index = index
+        
+        # Screen coordinates of every node, indexed by flat node index, so
+        # geometry loops can read positions without per-node method calls
+        self._node_positions = [node.get_position() for node in self._flat_nodes]
+        
+        # Angle of every node around the board center, indexed by flat node index
+        self._node_angles = [math.atan2(y - self.center_y, x - self.center_x) for x, y in self._node_positions]
+        
         # Define the center node (starting position)
         self.center_node = self.nodes[0][0]  # The only node in the innermost "circle"
         
         # The outermost circle has multiple nodes, any of which can be a goal
         self.outermost_circle_idx = self.num_circles - 1
         
-        # Define movement directions for each circle (alternating)
-        self.circle_directions = []
-        for i in range(num_circles):
-            # Even circles go counter-clockwise, odd circles go clockwise
-            # Switched from the original pattern
-            self.circle_directions.append(-1 if i % 2 == 0 else 1)
+        # Movement directions for each circle (alternating), kept as a list for callers
+        self.circle_directions = [self._circle_direction(i) for i in range(num_circles)]
+        
+        # Precompute the static movement graph
+        self._setup_neighbours()
+        self._setup_geometric_moves()
+        
+        # Precompute the direction triangles drawn on the board
+        self._setup_direction_triangles()
+        
+        # Bucket the nodes into a grid for position lookups
+        self._setup_node_grid()
         
         # Define snakes and foxes (special nodes)
         self._setup_special_nodes()
@@ -165,6 +272,25 @@ class Board:
         self._setup_fox_pieces()
         self._setup_snake_pieces()
         
+        # Animation properties for fox and snake pieces
+        self.fox_animations = {}  # Dictionary mapping fox node to animation data
+        self.snake_animations = {}  # Dictionary mapping snake node to animation data
+        self._animation_paths = {}  # Paths by (start, target) flat node index
+        
+        # Shapes of fox and snake pieces resting on each node, indexed by flat
+        # node index; only animated pieces need their shape computed per frame
+        self._fox_shapes = [self._fox_triangle(*self.get_fox_position(node)) for node in self._flat_nodes]
+        self._snake_shapes = [self._snake_squiggle(*self.get_snake_position(node)) for node in self._flat_nodes]
+        
+        # Static board drawing and ring text, built on first render (fonts need
+        # pygame to be initialized)
+        self._background = None
+        
+        # Static board with the resting pieces drawn on it, and the piece
+        # positions it shows
+        self._board_layer = None
+        self._board_layer_state = None
+        
         # Colors
         self.normal_color = (200, 200, 200)
         self.snake_color = (0, 200, 0)     # Green for snakes
@@ -192,12 +318,18 @@ class Board:
         """
         nodes = []
         
+        # Every circle uses the same angles, so compute the unit circle once
+        angles = [2 * math.pi * node_idx / self.nodes_per_circle
+                  for node_idx in range(self.nodes_per_circle)]
+        cos_table = [math.cos(angle) for angle in angles]
+        sin_table = [math.sin(angle) for angle in angles]
+        
         # Generate nodes for each circle
         for circle_idx in range(self.num_circles):
             circle_nodes = []
             
             # Calculate the radius for this circle
-            circle_radius = (circle_idx + 1) * self.circle_spacing
+            circle_radius = self._circle_radii[circle_idx]
             
             # Innermost circle (circle_idx = 0) is a single node at the center
             if circle_idx == 0:
@@ -207,12 +339,9 @@ class Board:
             else:
                 # Other circles have multiple nodes
                 for node_idx in range(self.nodes_per_circle):
-                    # Calculate angle for this node
-                    angle = 2 * math.pi * node_idx / self.nodes_per_circle
-                    
                     # Calculate coordinates
-                    x = self.center_x + circle_radius * math.cos(angle)
-                    y = self.center_y + circle_radius * math.sin(angle)
+                    x = self.center_x + circle_radius * cos_table[node_idx]
+                    y = self.center_y + circle_radius * sin_table[node_idx]
                     
                     # Create the node
                     node = BoardNode(int(x), int(y), circle_idx, node_idx)
@@ -222,6 +351,124 @@ class Board:
         
         return nodes
     
+    def _setup_neighbours(self):
+        """
+        Precompute the neighbours of every node.
+        
+        The board graph never changes after construction, so the direction,
+        wrap-around and inner/outer lookups are done once here. Movement
+        queries only have to filter the precomputed nodes by occupancy.
+        
+        For each node (indexed by its flat index) this stores:
+        - _neighbours: (next node in the circle's direction, inner node, outer node),
+          with None where there is no inner or outer circle. The center is a
+          circle of one node, so its next node is the center itself.
+        - _ring_steps: the nodes reached by moving k steps in the circle's
+          direction, indexed by k modulo the circle size
+        - _adjacent_indices: the flat indices of the neighbours, for fast
+          adjacency tests
+        """
+        self._neighbours = []
+        self._ring_steps = []
+        self._adjacent_indices = []
+        
+        for node in self._flat_nodes:
+            circle_idx = node.circle_idx
+            node_idx = node.node_idx
+            direction = self._circle_direction(circle_idx)
+            row_length = self._row_length[circle_idx]
+            
+            ring_steps = tuple(self.get_node(circle_idx, node_idx + direction * step)
+                               for step in range(row_length))
+            
+            # If moving to center (innermost), there's only one node there
+            if circle_idx == 0:
+                inner_node = None
+            elif circle_idx == 1:
+                inner_node = self.center_node
+            else:
+                inner_node = self.get_node(circle_idx - 1, node_idx)
+            
+            if circle_idx < self.num_circles - 1:
+                outer_node = self.get_node(circle_idx + 1, node_idx)
+            else:
+                outer_node = None
+            
+            neighbours = (ring_steps[1 % row_length], inner_node, outer_node)
+            self._neighbours.append(neighbours)
+            self._ring_steps.append(ring_steps)
+            self._adjacent_indices.append(frozenset(neighbour.index for neighbour in neighbours if neighbour))
+    
+    def _setup_direction_triangles(self):
+        """
+        Precompute the direction triangles drawn between adjacent nodes.
+        
+        Each triangle sits at the midpoint of the arc between two neighbouring
+        nodes of a circle (skipping the innermost) and points in the circle's
+        direction of movement.
+        """
+        self._direction_triangles = []
+        center_x, center_y = self.center_x, self.center_y
+        triangle_size = 5
+        
+        for circle_idx in range(1, self.num_circles):
+            circle_nodes = self.nodes[circle_idx]
+            direction = self._circle_direction(circle_idx)
+            radius = self._circle_radii[circle_idx]
+            
+            for i in range(len(circle_nodes)):
+                # Get angles for the arc
+                start_angle = self._node_angles[circle_nodes[i].index]
+                end_angle = self._node_angles[circle_nodes[(i + 1) % len(circle_nodes)].index]
+                
+                # Unwrap the angles in the direction of movement
+                if direction == 1:  # Clockwise
+                    if end_angle > start_angle:
+                        end_angle -= 2 * math.pi
+                else:  # Counter-clockwise
+                    if start_angle > end_angle:
+                        start_angle -= 2 * math.pi
+                
+                # Calculate position for the triangle at the midpoint of the arc
+                mid_angle = (start_angle + end_angle) / 2
+                mid_x = center_x + radius * math.cos(mid_angle)
+                mid_y = center_y + radius * math.sin(mid_angle)
+                
+                # Calculate direction tangent to the circle (in the direction of movement)
+                if direction == 1:  # Clockwise
+                    dir_angle = mid_angle + math.pi / 2
+                else:  # Counter-clockwise
+                    dir_angle = mid_angle - math.pi / 2
+                
+                # Calculate triangle points
+                triangle_tip = (mid_x + triangle_size * math.cos(dir_angle),
+                                mid_y + triangle_size * math.sin(dir_angle))
+                
+                side_angle1 = dir_angle + 2.5
+                side_angle2 = dir_angle - 2.5
+                triangle_side1 = (mid_x + triangle_size * math.cos(side_angle1),
+                                  mid_y + triangle_size * math.sin(side_angle1))
+                triangle_side2 = (mid_x + triangle_size * math.cos(side_angle2),
+                                  mid_y + triangle_size * math.sin(side_angle2))
+                
+                self._direction_triangles.append([triangle_tip, triangle_side1, triangle_side2])
+    
+    def _setup_node_grid(self):
+        """
+        Bucket every node except the center into a uniform grid of screen cells.
+        
+        Cells are one node diameter wide, so any node whose circle contains a
+        point lies in that point's cell or one of the eight cells around it.
+        The center node is larger and is checked separately by callers.
+        """
+        self._node_grid_cell = 2 * self.node_radius
+        self._node_grid = {}
+        cell_size = self._node_grid_cell
+        
+        for index in range(1, len(self._flat_nodes)):
+            x, y = self._node_positions[index]
+            self._node_grid.setdefault((x // cell_size, y // cell_size), []).append(index)
+    
     def _setup_special_nodes(self):
         """Set up snakes and foxes (special nodes) on the board."""
         # Only add snakes and foxes to the outermost circle
@@ -242,6 +489,17 @@ class Board:
                 # This is a placeholder - foxes don't do anything on the outermost circle
                 node.is_fox = True
                 node.fox_target = node  # Stay in the same position
+        
+        # Where each node sends a player, indexed by flat node index (None for
+        # normal nodes), so special effects are resolved with a single lookup
+        self._special_targets = []
+        for node in self._flat_nodes:
+            if node.is_snake and node.snake_target:
+                self._special_targets.append(node.snake_target)
+            elif node.is_fox and node.fox_target:
+                self._special_targets.append(node.fox_target)
+            else:
+                self._special_targets.append(None)
     
     def _setup_fox_pieces(self):
         """Set up fox pieces on the board."""
@@ -265,6 +523,21 @@ class Board:
                 node = self.get_node(circle_idx, node_idx)
                 self.snake_pieces.append(node)
     
+    @staticmethod
+    def _circle_direction(circle_idx: int) -> int:
+        """
+        Get the movement direction of a circle.
+        
+        Even circles go counter-clockwise, odd circles go clockwise.
+        
+        Args:
+            circle_idx: Index of the circle (0 = innermost)
+            
+        Returns:
+            1 for clockwise, -1 for counter-clockwise
+        """
+        return 1 if circle_idx & 1 else -1
+    
     def get_node(self, circle_idx: int, node_idx: int) -> Optional[BoardNode]:
         """
         Get a node by its circle and node indices.
@@ -278,8 +551,7 @@ class Board:
         """
         if 0 <= circle_idx < self.num_circles:
             # Normalize node_idx to wrap around the circle
-            node_idx = node_idx % self.nodes_per_circle
-            return self.nodes[circle_idx][node_idx]
+            return self._flat_nodes[self._row_offset[circle_idx] + node_idx % self._row_length[circle_idx]]
         return None
     
     def get_node_color(self, node: BoardNode) -> Tuple[int, int, int]:
@@ -299,6 +571,9 @@ class Board:
         """
         Get valid moves from the current node based on dice value.
         
+        Results are cached until a piece moves, since the moves only depend
+        on the arguments and on which nodes are occupied.
+        
         Args:
             current_node: The current node
             dice_value: The dice roll value
@@ -308,252 +583,222 @@ class Board:
         Returns:
             List of valid destination nodes
         """
+        # Make sure the cache belongs to the current occupancy
+        occupancy = self._get_occupancy()
+        
+        key = ("moves", current_node.index, dice_value, is_player,
+               previous_node.index if previous_node else -1)
+        valid_moves = self._move_cache.get(key)
+        if valid_moves is None:
+            valid_moves = self._find_valid_moves(current_node, dice_value, is_player, previous_node, occupancy)
+            self._move_cache[key] = valid_moves
+        
+        # Return a copy so callers can modify their list freely
+        return list(valid_moves)
+    
+    def _find_valid_moves(self, current_node: BoardNode, dice_value: int, is_player: bool, previous_node: Optional[BoardNode],
+                          occupancy: Tuple[int, int]) -> List[BoardNode]:
+        """
+        Compute valid moves from the current node based on dice value.
+        
+        The geometric candidates come from the precomputed move table, so only
+        the occupancy filter runs here.
+        
+        Args:
+            current_node: The current node
+            dice_value: The dice roll value
+            is_player: Whether the current node is a player node
+            previous_node: The previous node the player was on (for multi-move turns)
+            occupancy: The (player mask, enemy mask) from _get_occupancy
+            
+        Returns:
+            List of valid destination nodes
+        """
+        key = (current_node.index, dice_value, is_player)
+        candidates = self._geometric_moves.get(key)
+        if candidates is None:
+            candidates = self._get_geometric_moves(current_node, dice_value, is_player)
+            self._geometric_moves[key] = candidates
+        
+        # Test candidates against the masks fetched once for this query
+        player_mask, enemy_mask = occupancy
+        is_occupied_in = self._is_occupied_in
+        
         valid_moves = []
+        for node in candidates:
+            if node is _PREVIOUS_NODE:
+                # Also add the previous node if it exists and is not already in valid_moves
+                if previous_node and previous_node not in valid_moves:
+                    valid_moves.append(previous_node)
+            # Check if the node is not occupied or is the previous node
+            elif node is previous_node or not is_occupied_in(node, current_node, player_mask, enemy_mask):
+                valid_moves.append(node)
+        
+        return valid_moves
+    
+    def _setup_geometric_moves(self):
+        """Precompute the geometric move candidates for every node and dice roll of one to six."""
+        self._geometric_moves = {}
+        for node in self._flat_nodes:
+            for dice_value in range(1, 7):
+                for is_player in (False, True):
+                    self._geometric_moves[(node.index, dice_value, is_player)] = \
+                        self._get_geometric_moves(node, dice_value, is_player)
+    
+    def _get_geometric_moves(self, current_node: BoardNode, dice_value: int, is_player: bool) -> Tuple:
+        """
+        Get the move candidates from a node based on dice value, ignoring occupancy.
         
-        # Get current circle and node indices
+        Args:
+            current_node: The current node
+            dice_value: The dice roll value
+            is_player: Whether the current node is a player node
+            
+        Returns:
+            Tuple of candidate destination nodes, in the order they are offered.
+            _PREVIOUS_NODE marks where the previous node is offered as well.
+        """
+        # Get current circle and the precomputed neighbours
         circle_idx = current_node.circle_idx
-        node_idx = current_node.node_idx
+        ring_steps = self._ring_steps[current_node.index]
+        adj_node, inner_node, outer_node = self._neighbours[current_node.index]
         
         # Special case for center node (innermost circle)
         if circle_idx == 0:
             # From center, can only move to first circle with dice value 1
-            if dice_value == 1:
-                # Can move to any node in the first circle with a roll of 1
-                for first_circle_node in self.nodes[1]:
-                    # Check if the node is not occupied or is the previous node
-                    if not self.is_node_occupied(first_circle_node, current_node) or (previous_node and first_circle_node.x == previous_node.x and first_circle_node.y == previous_node.y):
-                        valid_moves.append(first_circle_node)
-            return valid_moves
-        
-        # Special case for outermost circle - allow movement to any node in the circle
+            # Can move to any node in the first circle with a roll of 1
+            return tuple(self.nodes[1]) if dice_value == 1 else ()
+        
+        # Special case for outermost circle
         if is_player and circle_idx == self.num_circles - 1:
             # For dice value > 1, use the standard movement within the circle
             if dice_value > 1:
-                direction = self.circle_directions[circle_idx]
-                new_node_idx = (node_idx + direction * dice_value) % len(self.nodes[circle_idx])
-                same_circle_node = self.get_node(circle_idx, new_node_idx)
-                
-                if same_circle_node and (not self.is_node_occupied(same_circle_node, current_node) or 
-                                      (previous_node and same_circle_node.x == previous_node.x and same_circle_node.y == previous_node.y)):
-                    valid_moves.append(same_circle_node)
-                return valid_moves
-            
-            # For dice value 1, allow movement ONLY to adjacent nodes in the proper direction
-            direction = self.circle_directions[circle_idx]
-            adj_node_idx = (node_idx + direction) % self.nodes_per_circle
-            adj_node = self.get_node(circle_idx, adj_node_idx)
-            
-            # Check if the adjacent node is the previous node or not occupied
-            if adj_node and (not self.is_node_occupied(adj_node, current_node) or 
-                           (previous_node and adj_node.x == previous_node.x and adj_node.y == previous_node.y)):
-                valid_moves.append(adj_node)
+                return (ring_steps[dice_value % len(ring_steps)],)
             
-            # Also add the previous node if it exists and is not already in valid_moves
-            if previous_node and previous_node not in valid_moves:
-                valid_moves.append(previous_node)
-            
-            # Add inner circle node (for moving inward)
-            if circle_idx > 0:
-                inner_node = self.get_node(circle_idx - 1, node_idx)
-                if inner_node and (not self.is_node_occupied(inner_node, current_node) or 
-                                  (previous_node and inner_node.x == previous_node.x and inner_node.y == previous_node.y)):
-                    valid_moves.append(inner_node)
-            
-            return valid_moves
-        # For all other circles (not outermost):
+            # For dice value 1, allow movement ONLY to the adjacent node in the proper
+            # direction, back to the previous node, or inward
+            return (adj_node, _PREVIOUS_NODE, inner_node)
         
+        # For all other circles (not outermost):
         # 1. Move within the same circle
-        direction = self.circle_directions[circle_idx]
-        new_node_idx = (node_idx + direction * dice_value) % len(self.nodes[circle_idx])
-        same_circle_node = self.get_node(circle_idx, new_node_idx)
-        
-        if same_circle_node and (not self.is_node_occupied(same_circle_node, current_node) or 
-                               (previous_node and same_circle_node.x == previous_node.x and same_circle_node.y == previous_node.y)):
-            valid_moves.append(same_circle_node)
+        candidates = [ring_steps[dice_value % len(ring_steps)]]
         
         # 2. Move to adjacent circle (if dice value matches)
         if dice_value == 1:
             # Move inward (if not at innermost circle)
-            if circle_idx > 0:
-                # If moving to center (innermost), there's only one node there
-                if circle_idx == 1:
-                    inner_node = self.center_node
-                else:
-                    inner_node = self.get_node(circle_idx - 1, node_idx)
-                
-                # Check if the node is not occupied or is the previous node
-                if inner_node and (not self.is_node_occupied(inner_node, current_node) or 
-                                 (previous_node and inner_node.x == previous_node.x and inner_node.y == previous_node.y)):
-                    valid_moves.append(inner_node)
+            if inner_node:
+                candidates.append(inner_node)
             
-            # Move outward (if not at outermost circle)
-            if circle_idx < self.num_circles - 1:
-                outer_node = self.get_node(circle_idx + 1, node_idx)
-                
-                # For players, allow movement to the outermost circle even if occupied by enemy pieces
-                if is_player and circle_idx == self.num_circles - 2:  # Moving to outermost circle
-                    # Check if the outer node is the previous node - if so, always allow movement to it
-                    if previous_node and outer_node.x == previous_node.x and outer_node.y == previous_node.y:
-                        valid_moves.append(outer_node)
-                    else:
-                        # Check if it's occupied by another player, snake, or fox
-                        is_occupied_by_player = False
-                        for player_node in self.player_pieces:
-                            if (outer_node.x == player_node.x and outer_node.y == player_node.y and 
-                                (current_node.x != player_node.x or current_node.y != player_node.y)):
-                                is_occupied_by_player = True
-                                break
-                        
-                        # Check if the node is occupied by a fox or snake
-                        is_occupied_by_enemy = False
-                        for fox_node in self.fox_pieces:
-                            if outer_node.x == fox_node.x and outer_node.y == fox_node.y:
-                                is_occupied_by_enemy = True
-                                break
-                        
-                        for snake_node in self.snake_pieces:
-                            if outer_node.x == snake_node.x and outer_node.y == snake_node.y:
-                                is_occupied_by_enemy = True
-                                break
-                        
-                        if not is_occupied_by_player and not is_occupied_by_enemy:
-                            valid_moves.append(outer_node)
+            # Players can move outward onto the outermost circle, unless it is occupied
+            if outer_node and is_player and circle_idx == self.num_circles - 2:
+                candidates.append(outer_node)
         
-        return valid_moves
+        return tuple(candidates)
     
     def get_connected_nodes(self, current_node: BoardNode, is_player: bool = False, previous_node: Optional[BoardNode] = None) -> List[BoardNode]:
         """
         Get all nodes that have a directed edge connecting to the current node.
         
+        Results are cached until a piece moves, like get_valid_moves.
+        
+        Args:
+            current_node: The current node
+            is_player: Whether the current node is a player node
+            previous_node: The previous node the player was on (for multi-move turns)
+            
+        Returns:
+            List of connected nodes
+        """
+        # Make sure the cache belongs to the current occupancy
+        occupancy = self._get_occupancy()
+        
+        key = ("connected", current_node.index, is_player,
+               previous_node.index if previous_node else -1)
+        connected_nodes = self._move_cache.get(key)
+        if connected_nodes is None:
+            connected_nodes = self._find_connected_nodes(current_node, is_player, previous_node, occupancy)
+            self._move_cache[key] = connected_nodes
+        
+        # Return a copy so callers can modify their list freely
+        return list(connected_nodes)
+    
+    def _find_connected_nodes(self, current_node: BoardNode, is_player: bool, previous_node: Optional[BoardNode],
+                              occupancy: Tuple[int, int]) -> List[BoardNode]:
+        """
+        Compute all nodes that have a directed edge connecting to the current node.
+        
         Args:
             current_node: The current node
             is_player: Whether the current node is a player node
             previous_node: The previous node the player was on (for multi-move turns)
+            occupancy: The (player mask, enemy mask) from _get_occupancy
             
         Returns:
             List of connected nodes
         """
         connected_nodes = []
         
-        # Get current circle and node indices
+        # Bind frequently used attributes once, and test candidates against
+        # the masks fetched once for this query
+        player_mask, enemy_mask = occupancy
+        is_occupied_in = self._is_occupied_in
+        num_circles = self.num_circles
+        
+        # Get current circle and the precomputed neighbours
         circle_idx = current_node.circle_idx
-        node_idx = current_node.node_idx
+        next_node, inner_node, outer_node = self._neighbours[current_node.index]
         
-        # Special case for center node (innermost circle)
+        # Special case for center node (innermost circle). Its precomputed next
+        # node is the center itself, so the first circle is listed instead
         if circle_idx == 0:
             # From center, can move to any node in the first circle
             for first_circle_node in self.nodes[1]:
                 # Check if the node is not occupied or is the previous node
-                if not self.is_node_occupied(first_circle_node, current_node) or (previous_node and first_circle_node.x == previous_node.x and first_circle_node.y == previous_node.y):
+                if (not is_occupied_in(first_circle_node, current_node, player_mask, enemy_mask)
+                        or first_circle_node is previous_node):
                     connected_nodes.append(first_circle_node)
             return connected_nodes
         
         # Special case for outermost circle
-        if is_player and circle_idx == self.num_circles - 1:
+        if is_player and circle_idx == num_circles - 1:
             # Only allow movement to the adjacent node in the direction of rotation
-            direction = self.circle_directions[circle_idx]
-            adj_node_idx = (node_idx + direction) % self.nodes_per_circle
-            adj_node = self.get_node(circle_idx, adj_node_idx)
+            adj_node = next_node
             
             # Check if the adjacent node is not occupied by a player or enemy
-            if adj_node:
-                is_occupied_by_player = False
-                for player_node in self.player_pieces:
-                    if (adj_node.x == player_node.x and adj_node.y == player_node.y and 
-                        (current_node.x != player_node.x or current_node.y != player_node.y)):
-                        is_occupied_by_player = True
-                        break
-                
-                is_occupied_by_enemy = False
-                for fox_node in self.fox_pieces:
-                    if adj_node.x == fox_node.x and adj_node.y == fox_node.y:
-                        is_occupied_by_enemy = True
-                        break
-                
-                for snake_node in self.snake_pieces:
-                    if adj_node.x == snake_node.x and adj_node.y == snake_node.y:
-                        is_occupied_by_enemy = True
-                        break
-                
-                if not is_occupied_by_player and not is_occupied_by_enemy:
-                    connected_nodes.append(adj_node)
+            if not is_occupied_in(adj_node, current_node, player_mask, enemy_mask):
+                connected_nodes.append(adj_node)
             
-            # Also add the previous node if it exists and is not already in connected_nodes
-            if previous_node and previous_node not in connected_nodes:
+            # Also add the previous node if it exists and is not already in connected_nodes.
+            # The adjacent node is the only entry so far, so check it directly.
+            if previous_node and not (connected_nodes and connected_nodes[0] is previous_node):
                 connected_nodes.append(previous_node)
             
             # Add inner circle node (for moving inward)
-            if circle_idx > 0:
-                inner_node = self.get_node(circle_idx - 1, node_idx)
-                if inner_node and (not self.is_node_occupied(inner_node, current_node) or 
-                                  (previous_node and inner_node.x == previous_node.x and inner_node.y == previous_node.y)):
-                    connected_nodes.append(inner_node)
+            if inner_node and (not is_occupied_in(inner_node, current_node, player_mask, enemy_mask) or 
+                               inner_node is previous_node):
+                connected_nodes.append(inner_node)
             
             return connected_nodes
         
         # For all other circles (not outermost):
         
         # 1. Move within the same circle (only in the direction of the arrows)
-        direction = self.circle_directions[circle_idx]
-        
-        # Only allow movement in the direction of the arrows
-        next_node_idx = (node_idx + direction) % len(self.nodes[circle_idx])
-        next_node = self.get_node(circle_idx, next_node_idx)
-        
-        if next_node and (not self.is_node_occupied(next_node, current_node) or 
-                         (previous_node and next_node.x == previous_node.x and next_node.y == previous_node.y)):
+        if (not is_occupied_in(next_node, current_node, player_mask, enemy_mask) or 
+                next_node is previous_node):
             connected_nodes.append(next_node)
         
         # 2. Move to adjacent circles
         
         # Move inward (if not at innermost circle)
-        if circle_idx > 0:
-            # If moving to center (innermost), there's only one node there
-            if circle_idx == 1:
-                inner_node = self.center_node
-            else:
-                inner_node = self.get_node(circle_idx - 1, node_idx)
-            
-            if inner_node and (not self.is_node_occupied(inner_node, current_node) or 
-                              (previous_node and inner_node.x == previous_node.x and inner_node.y == previous_node.y)):
-                connected_nodes.append(inner_node)
+        if inner_node and (not is_occupied_in(inner_node, current_node, player_mask, enemy_mask) or 
+                           inner_node is previous_node):
+            connected_nodes.append(inner_node)
         
-        # Move outward (if not at outermost circle)
-        if circle_idx < self.num_circles - 1:
-            outer_node = self.get_node(circle_idx + 1, node_idx)
-            
-            # For players, allow movement to the outermost circle even if occupied by enemy pieces
-            if is_player and circle_idx == self.num_circles - 2:  # Moving to outermost circle
-                # Check if the outer node is the previous node - if so, always allow movement to it
-                if previous_node and outer_node.x == previous_node.x and outer_node.y == previous_node.y:
-                    connected_nodes.append(outer_node)
-                else:
-                    # Only check if it's occupied by another player, not by enemy pieces
-                    is_occupied_by_player = False
-                    for player_node in self.player_pieces:
-                        if (player_node == outer_node and 
-                            current_node != player_node):
-                            is_occupied_by_player = True
-                            break
-                    
-                    # Check if the node is occupied by a fox or snake
-                    is_occupied_by_enemy = False
-                    for fox_node in self.fox_pieces:
-                        if outer_node.x == fox_node.x and outer_node.y == fox_node.y:
-                            is_occupied_by_enemy = True
-                            break
-                    
-                    for snake_node in self.snake_pieces:
-                        if outer_node.x == snake_node.x and outer_node.y == snake_node.y:
-                            is_occupied_by_enemy = True
-                            break
-                    
-                    if not is_occupied_by_player and not is_occupied_by_enemy:
-                        connected_nodes.append(outer_node)
-            # For all other cases
-            elif outer_node and (not self.is_node_occupied(outer_node, current_node) or 
-                               (previous_node and outer_node.x == previous_node.x and outer_node.y == previous_node.y)):
-                connected_nodes.append(outer_node)
+        # Move outward (if not at outermost circle).
+        # This includes players stepping onto the outermost circle.
+        if outer_node and (not is_occupied_in(outer_node, current_node, player_mask, enemy_mask) or 
+                           outer_node is previous_node):
+            connected_nodes.append(outer_node)
         
         return connected_nodes
     
@@ -567,11 +812,12 @@ class Board:
         Returns:
             The new node after applying any special effects
         """
-        if node.is_snake and node.snake_target:
-            return node.snake_target
-        elif node.is_fox and node.fox_target:
-            return node.fox_target
-        return node
+        # Nodes that don't belong to the board have no special effect
+        if node.index < 0:
+            return node
+        
+        target = self._special_targets[node.index]
+        return node if target is None else target
     
     def find_closest_pieces(self, pieces, target_node):
         """
@@ -584,20 +830,15 @@ class Board:
         Returns:
             List of piece nodes sorted by distance (closest first)
         """
-        # Calculate distances from each piece to the target node
-        piece_distances = []
-        for piece_node in pieces:
-            # Calculate Euclidean distance between piece and target
-            piece_x, piece_y = piece_node.get_position()
-            target_x, target_y = target_node.get_position()
-            distance = ((piece_x - target_x) ** 2 + (piece_y - target_y) ** 2) ** 0.5
-            piece_distances.append((piece_node, distance))
-        
-        # Sort pieces by distance (closest first)
-        piece_distances.sort(key=lambda x: x[1])
-        
-        # Return just the piece nodes in order of distance
-        return [piece[0] for piece in piece_distances]
+        target_x, target_y = target_node.x, target_node.y
+
+        # Sort by squared Euclidean distance (closest first). The square root is
+        # monotonic, so skipping it leaves the order unchanged.
+        return sorted(
+            pieces,
+            key=lambda piece_node: (piece_node.x - target_x) * (piece_node.x - target_x) +
+                                   (piece_node.y - target_y) * (piece_node.y - target_y)
+        )
     
     def find_closest_foxes(self, target_node):
         """
@@ -638,82 +879,37 @@ class Board:
         # First check if the player is in a directly connected node
         # If so, prioritize capturing the player
         
-        # Get all possible connected nodes without occupation check
+        # Check the precomputed neighbours without occupation check
         # This is important for capture mechanics
-        connected_nodes_raw = []
-        
-        # Get current circle and node indices
-        circle_idx = piece_node.circle_idx
-        node_idx = piece_node.node_idx
-        
-        # Add node in the same circle
-        direction = self.circle_directions[circle_idx]
-        next_node_idx = (node_idx + direction) % len(self.nodes[circle_idx])
-        next_node = self.get_node(circle_idx, next_node_idx)
-        if next_node:
-            connected_nodes_raw.append(next_node)
-        
-        # Add nodes in adjacent circles
-        if circle_idx > 0:
-            # If moving to center (innermost), there's only one node there
-            if circle_idx == 1:
-                inner_node = self.center_node
-            else:
-                inner_node = self.get_node(circle_idx - 1, node_idx)
-            
-            if inner_node:
-                connected_nodes_raw.append(inner_node)
-        
-        if circle_idx < self.num_circles - 1:
-            outer_node = self.get_node(circle_idx + 1, node_idx)
-            if outer_node:
-                connected_nodes_raw.append(outer_node)
-        
-        # Check if player is in a directly connected node
-        for node in connected_nodes_raw:
-            if node.x == player_node.x and node.y == player_node.y:
-                # Found the player! Move to capture
-                piece_index = piece_list.index(piece_node)
-                piece_list[piece_index] = node
-                return node
-        
-        # If we can't capture directly, move toward the player
-        # Get all connected nodes from the piece's current position
-        # We need to temporarily remove the piece from its current position
-        # to avoid it blocking itself when calculating connected nodes
-        piece_index = piece_list.index(piece_node)
-        piece_list.pop(piece_index)
-        
-        # Now get connected nodes (this will consider other occupied nodes)
-        connected_nodes = self.get_connected_nodes(piece_node)
-        
-        # Put the piece back in its original position
-        piece_list.insert(piece_index, piece_node)
-        
-        if not connected_nodes:
-            return piece_node  # No valid moves, stay in place
-        
-        # Find the connected node that's closest to the player
-        closest_node = None
-        min_distance = float('inf')
-        
-        for node in connected_nodes:
-            # Calculate distance from this node to the player
-            node_x, node_y = node.get_position()
+        if player_node.index in self._adjacent_indices[piece_node.index]:
+            # Found the player! Move to capture
+            new_node = player_node
+        else:
+            # If we can't capture directly, move toward the player
+            # Get all connected nodes from the piece's current position (this will
+            # consider other occupied nodes). The result never contains the piece's
+            # own node, so the piece cannot block its own moves: the center is the
+            # only node that neighbours itself, and moves from it are taken from
+            # the first circle instead of its neighbours.
+            connected_nodes = self.get_connected_nodes(piece_node)
+            
+            if not connected_nodes:
+                return piece_node  # No valid moves, stay in place
+            
+            # Find the connected node that's closest to the player, comparing
+            # squared distances since the square root is monotonic
+            node_positions = self._node_positions
             player_x, player_y = player_node.get_position()
-            distance = ((node_x - player_x) ** 2 + (node_y - player_y) ** 2) ** 0.5
             
-            if distance < min_distance:
-                min_distance = distance
-                closest_node = node
-        
-        # Move the piece to the closest node
-        if closest_node:
-            # Update piece position in the list
-            piece_list[piece_index] = closest_node
-            return closest_node
+            def squared_distance_to_player(node):
+                node_x, node_y = node_positions[node.index]
+                return (node_x - player_x) * (node_x - player_x) + (node_y - player_y) * (node_y - player_y)
+            
+            new_node = min(connected_nodes, key=squared_distance_to_player)
         
-        return piece_node  # No valid moves, stay in place
+        # Update the piece position in the list (a single lookup of its slot)
+        piece_list[piece_list.index(piece_node)] = new_node
+        return new_node
     
     def move_fox_toward_player(self, fox_node, player_node):
         """
@@ -729,7 +925,7 @@ class Board:
         target_node = self.move_piece_toward_player(fox_node, player_node, self.fox_pieces)
         
         # Start animation for the fox piece
-        if target_node != fox_node:
+        if target_node is not fox_node:
             self.start_piece_animation(fox_node, target_node, is_fox=True)
         
         return target_node
@@ -748,7 +944,7 @@ class Board:
         target_node = self.move_piece_toward_player(snake_node, player_node, self.snake_pieces)
         
         # Start animation for the snake piece
-        if target_node != snake_node:
+        if target_node is not snake_node:
             self.start_piece_animation(snake_node, target_node, is_fox=False)
         
         return target_node
@@ -762,14 +958,14 @@ class Board:
             target_node: The target node
             is_fox: True if this is a fox piece, False if it's a snake piece
         """
-        # Calculate the animation path
-        animation_path = self.calculate_piece_animation_path(start_node, target_node)
+        animation_path = self.get_animation_path(start_node, target_node)
         
         # Store the animation data
         animation_data = {
             'start_node': start_node,
             'target_node': target_node,
             'path': animation_path,
+            'last_index': len(animation_path) - 1,
             'progress': 0.0
         }
         
@@ -779,6 +975,27 @@ class Board:
         else:
             self.snake_animations[target_node] = animation_data
     
+    def get_animation_path(self, start_node, target_node):
+        """
+        Get the animation path between two nodes, calculating it only once.
+        
+        The path only depends on the two nodes, so it is cached per pair and
+        shared by every later animation; callers must not modify it.
+        
+        Args:
+            start_node: The starting node
+            target_node: The target node
+            
+        Returns:
+            List of points defining the animation path
+        """
+        key = (start_node.index, target_node.index)
+        animation_path = self._animation_paths.get(key)
+        if animation_path is None:
+            animation_path = self.calculate_piece_animation_path(start_node, target_node)
+            self._animation_paths[key] = animation_path
+        return animation_path
+    
     def calculate_piece_animation_path(self, start_node, target_node):
         """
         Calculate the path for a piece animation.
@@ -790,19 +1007,13 @@ class Board:
         Returns:
             List of points defining the animation path
         """
-        animation_path = []
-        
         # Case 1: Moving within the same circle (arc path)
         if start_node.circle_idx == target_node.circle_idx and start_node.circle_idx > 0:
             # Get the center of the board
             center_x, center_y = self.center_x, self.center_y
             
             # Get the circle radius
-            circle_radius = (start_node.circle_idx + 1) * self.circle_spacing
-            
-            # Get start and end positions
-            start_pos = start_node.get_position()
-            end_pos = target_node.get_position()
+            circle_radius = self._circle_radii[start_node.circle_idx]
             
             # Calculate node indices
             start_idx = start_node.node_idx
@@ -820,22 +1031,11 @@ class Board:
             rotation_angle = nodes_diff * angle_per_node
             
             # Get the starting angle in radians
-            start_vector = pygame.math.Vector2(start_pos[0] - center_x, start_pos[1] - center_y)
-            start_angle_rad = math.atan2(start_vector.y, start_vector.x)
+            start_angle_rad = self._node_angles[start_node.index]
             
             # Create points along the arc
-            num_points = 20  # Number of points in the path
-            
-            for i in range(num_points + 1):
-                # Interpolate angle
-                t = i / num_points
-                angle = start_angle_rad + rotation_angle * t
-                
-                # Calculate position
-                x = center_x + circle_radius * math.cos(angle)
-                y = center_y + circle_radius * math.sin(angle)
-                
-                animation_path.append((x, y))
+            animation_path = _arc_path(center_x, center_y, circle_radius,
+                                       start_angle_rad, rotation_angle, _ANIMATION_PATH_POINTS)
         
         # Case 2: Moving between circles (straight line)
         else:
@@ -844,41 +1044,24 @@ class Board:
             end_x, end_y = target_node.get_position()
             
             # Create points along the straight line
-            num_points = 20  # Number of points in the path
-            
-            for i in range(num_points + 1):
-                # Interpolate position
-                t = i / num_points
-                x = start_x + (end_x - start_x) * t
-                y = start_y + (end_y - start_y) * t
-                
-                animation_path.append((x, y))
+            animation_path = _line_path(start_x, start_y, end_x, end_y, _ANIMATION_PATH_POINTS)
         
         return animation_path
     
     def update_animations(self):
         """Update all piece animations."""
-        # Update fox animations
-        completed_fox_animations = []
-        for target_node, animation_data in self.fox_animations.items():
-            animation_data['progress'] += self.animation_speed
-            if animation_data['progress'] >= 1.0:
-                completed_fox_animations.append(target_node)
-        
-        # Remove completed fox animations
-        for target_node in completed_fox_animations:
-            self.fox_animations.pop(target_node)
-        
-        # Update snake animations
-        completed_snake_animations = []
-        for target_node, animation_data in self.snake_animations.items():
-            animation_data['progress'] += self.animation_speed
-            if animation_data['progress'] >= 1.0:
-                completed_snake_animations.append(target_node)
-        
-        # Remove completed snake animations
-        for target_node in completed_snake_animations:
-            self.snake_animations.pop(target_node)
+        speed = self.animation_speed
+        for animations in (self.fox_animations, self.snake_animations):
+            # Advance every animation in a single pass, noting the completed ones
+            completed = []
+            for target_node, animation_data in animations.items():
+                animation_data['progress'] += speed
+                if animation_data['progress'] >= 1.0:
+                    completed.append(target_node)
+            
+            # Remove completed animations in place
+            for target_node in completed:
+                del animations[target_node]
     
     def get_fox_position(self, fox_node):
         """
@@ -891,39 +1074,23 @@ class Board:
             The current (x, y) position
         """
         # Check if this fox is being animated
-        for target_node, animation_data in self.fox_animations.items():
-            if target_node == fox_node:
-                # Get the position from the animation path
-                path = animation_data['path']
-                progress = animation_data['progress']
-                
-                # Calculate the index in the animation path
-                path_index = min(int(progress * len(path)), len(path) - 1)
-                
-                # Return the position at that index
-                return path[path_index]
+        animation_data = self.fox_animations.get(fox_node)
+        if animation_data is not None:
+            # Calculate the index in the animation path
+            last_index = animation_data['last_index']
+            path_index = int(animation_data['progress'] * (last_index + 1))
+            if path_index > last_index:
+                path_index = last_index
+            
+            # Return the position at that index
+            return animation_data['path'][path_index]
         
         # If not being animated, return the node's position
         x, y = fox_node.get_position()
         
         # Apply offset for center node to prevent overlap with other pieces
-        if fox_node == self.center_node:
-            # Check if there are other pieces on the center node
-            other_pieces = 0
-            
-            # Count player pieces on center
-            for player_node in self.player_pieces:
-                if player_node.x == self.center_node.x and player_node.y == self.center_node.y:
-                    other_pieces += 1
-            
-            # Count snake pieces on center
-            for snake_node in self.snake_pieces:
-                if snake_node.x == self.center_node.x and snake_node.y == self.center_node.y:
-                    other_pieces += 1
-            
-            # Apply offset based on the number of other pieces
+        if fox_node is self.center_node:
             # Position fox at the top of the center node
-            x += 0
             y -= 15
         
         return (x, y)
@@ -939,200 +1106,150 @@ class Board:
             The current (x, y) position
         """
         # Check if this snake is being animated
-        for target_node, animation_data in self.snake_animations.items():
-            if target_node == snake_node:
-                # Get the position from the animation path
-                path = animation_data['path']
-                progress = animation_data['progress']
-                
-                # Calculate the index in the animation path
-                path_index = min(int(progress * len(path)), len(path) - 1)
-                
-                # Return the position at that index
-                return path[path_index]
+        animation_data = self.snake_animations.get(snake_node)
+        if animation_data is not None:
+            # Calculate the index in the animation path
+            last_index = animation_data['last_index']
+            path_index = int(animation_data['progress'] * (last_index + 1))
+            if path_index > last_index:
+                path_index = last_index
+            
+            # Return the position at that index
+            return animation_data['path'][path_index]
         
         # If not being animated, return the node's position
         x, y = snake_node.get_position()
         
         # Apply offset for center node to prevent overlap with other pieces
-        if snake_node == self.center_node:
-            # Check if there are other pieces on the center node
-            other_pieces = 0
-            
-            # Count player pieces on center
-            for player_node in self.player_pieces:
-                if player_node.x == self.center_node.x and player_node.y == self.center_node.y:
-                    other_pieces += 1
-            
-            # Count fox pieces on center
-            for fox_node in self.fox_pieces:
-                if fox_node.x == self.center_node.x and fox_node.y == self.center_node.y:
-                    other_pieces += 1
-            
-            # Apply offset based on the number of other pieces
+        if snake_node is self.center_node:
             # Position snake at the bottom of the center node
-            x += 0
             y += 15
         
         return (x, y)
     
-    def render(self, screen: pygame.Surface) -> None:
+    def _build_ring_text(self) -> List[Tuple[pygame.Surface, Tuple[float, float]]]:
         """
-        Render the board on the screen.
+        Render the phrases around the outermost circle.
+        
+        Each character is rendered and rotated once, since the text never
+        changes; the results are drawn into the static board background.
+        
+        Returns:
+            List of (rotated character surface, blit position) pairs
+        """
+        ring_text = []
+        circle_radius = self._circle_radii[self.num_circles - 1]
+        
+        # Define the four phrases to display
+        phrases = [
+            "Curage to strengthen",
+            "Iron to bind",
+            "Music to dazzle",
+            "Fire to blind"
+        ]
+        
+        # Create font for the text - increased font size
+        text_font = pygame.font.SysFont(None, 30)
+        
+        # Position the text at top-left, top-right, bottom-right, bottom-left positions around the circle
+        # Exact corner angles (in radians)
+        corner_angles = [
+            math.pi * 5 / 4,  # top-left (135 degrees)
+            math.pi * 7 / 4,  # top-right (315 degrees)
+            math.pi / 4,      # bottom-right (45 degrees)
+            math.pi * 3 / 4   # bottom-left (225 degrees)
+        ]
+        
+        # Add more distance from the circle
+        text_radius = circle_radius + 40  # Increased from 25 to 40
+        
+        for i, phrase in enumerate(phrases):
+            # Calculate the total angle span for the phrase
+            # Use a fixed angle span to ensure consistent spacing
+            total_angle_span = math.pi / 6  # 30 degrees
+            
+            # Calculate the start angle (so the middle of the phrase is at the corner)
+            center_angle = corner_angles[i]
+            start_angle = center_angle - total_angle_span / 2
+            
+            # Ensure consistent character spacing by using the same spacing for all phrases
+            char_angle = total_angle_span / max(len(phrases[0]), len(phrases[1]), len(phrases[2]), len(phrases[3]))
+            
+            # Adjust start angle to center the phrase
+            start_angle = center_angle - (char_angle * len(phrase)) / 2
+            
+            # Render each character separately
+            for j, char in enumerate(phrase):
+                # Calculate the angle for this character - use consistent spacing
+                angle = start_angle + char_angle * j
+                
+                # Render the character
+                char_surface = text_font.render(char, True, (50, 50, 50))
+                
+                # Calculate position for the character
+                char_x = self.center_x + text_radius * math.cos(angle)
+                char_y = self.center_y + text_radius * math.sin(angle)
+                
+                # Calculate rotation angle for radial text
+                rotation_angle = angle + math.pi/2
+                
+                # Rotate the character so the bottom points toward the center
+                rotated_surface = pygame.transform.rotate(
+                    char_surface, 
+                    -rotation_angle * 180 / math.pi  # Convert to degrees and negate for pygame rotation
+                )
+                
+                # Position the rotated text correctly (centered at the calculated position)
+                ring_text.append((rotated_surface, (
+                    char_x - rotated_surface.get_width() / 2,
+                    char_y - rotated_surface.get_height() / 2
+                )))
+        
+        return ring_text
+    
+    def _build_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Draw the static parts of the board onto a transparent surface.
+        
+        The circles, direction triangles, connecting lines, diamonds, nodes
+        and the text around the outermost circle never change, so they are
+        drawn once and blitted every frame.
         
         Args:
-            screen: The pygame surface to render on
+            size: Size of the screen the board is rendered on
+            
+        Returns:
+            Surface with the static board drawn on it
         """
+        background = pygame.Surface(size, pygame.SRCALPHA)
+        
+        # Precomputed node positions and circle radii
+        node_positions = self._node_positions
+        circle_radii = self._circle_radii
+        
         # Draw circles
         for circle_idx in range(1, self.num_circles):  # Skip innermost circle (it's just a node)
-            circle_radius = (circle_idx + 1) * self.circle_spacing
+            circle_radius = circle_radii[circle_idx]
             pygame.draw.circle(
-                screen,
+                background,
                 (0, 0, 0),  # Black
                 (self.center_x, self.center_y),
                 circle_radius,
                 1  # Line width
             )
-            
-            # Add text around the outermost circle
-            if circle_idx == self.num_circles - 1:
-                # Define the four phrases to display
-                phrases = [
-                    "Curage to strengthen",
-                    "Iron to bind",
-                    "Music to dazzle",
-                    "Fire to blind"
-                ]
-                
-                # Create font for the text - increased font size
-                text_font = pygame.font.SysFont(None, 30)
-                
-                # Position the text at top-left, top-right, bottom-right, bottom-left positions around the circle
-                # Exact corner angles (in radians)
-                corner_angles = [
-                    math.pi * 5 / 4,  # top-left (135 degrees)
-                    math.pi * 7 / 4,  # top-right (315 degrees)
-                    math.pi / 4,      # bottom-right (45 degrees)
-                    math.pi * 3 / 4   # bottom-left (225 degrees)
-                ]
-                
-                # Add more distance from the circle
-                text_radius = circle_radius + 40  # Increased from 25 to 40
-                
-                for i, phrase in enumerate(phrases):
-                    # Calculate the total angle span for the phrase
-                    # Use a fixed angle span to ensure consistent spacing
-                    total_angle_span = math.pi / 6  # 30 degrees
-                    
-                    # Calculate the start angle (so the middle of the phrase is at the corner)
-                    center_angle = corner_angles[i]
-                    start_angle = center_angle - total_angle_span / 2
-                    
-                    # Ensure consistent character spacing by using the same spacing for all phrases
-                    char_angle = total_angle_span / max(len(phrases[0]), len(phrases[1]), len(phrases[2]), len(phrases[3]))
-                    
-                    # Adjust start angle to center the phrase
-                    start_angle = center_angle - (char_angle * len(phrase)) / 2
-                    
-                    # Render each character separately
-                    for j, char in enumerate(phrase):
-                        # Calculate the angle for this character - use consistent spacing
-                        angle = start_angle + char_angle * j
-                        
-                        # Render the character
-                        char_surface = text_font.render(char, True, (50, 50, 50))
-                        
-                        # Calculate position for the character
-                        char_x = self.center_x + text_radius * math.cos(angle)
-                        char_y = self.center_y + text_radius * math.sin(angle)
-                        
-                        # Calculate rotation angle for radial text
-                        rotation_angle = angle + math.pi/2
-                        
-                        # Rotate the character so the bottom points toward the center
-                        rotated_surface = pygame.transform.rotate(
-                            char_surface, 
-                            -rotation_angle * 180 / math.pi  # Convert to degrees and negate for pygame rotation
-                        )
-                        
-                        # Position the rotated text correctly (centered at the calculated position)
-                        screen.blit(rotated_surface, (
-                            char_x - rotated_surface.get_width() / 2,
-                            char_y - rotated_surface.get_height() / 2
-                        ))
-        
-        # Draw connecting arcs between adjacent nodes in the same circle (skip innermost)
-        for circle_idx in range(1, self.num_circles):
-            circle_nodes = self.nodes[circle_idx]
-            direction = self.circle_directions[circle_idx]
-            
-            for i in range(len(circle_nodes)):
-                start_node = circle_nodes[i]
-                end_node = circle_nodes[(i + 1) % len(circle_nodes)]
-                
-                # Get start and end positions
-                start_pos = start_node.get_position()
-                end_pos = end_node.get_position()
-                
-                # Calculate center point of the circle
-                center = (self.center_x, self.center_y)
-                
-                # Calculate radius of this circle
-                radius = (circle_idx + 1) * self.circle_spacing
-                
-                # Calculate angles for the arc
-                start_angle = math.atan2(start_pos[1] - center[1], start_pos[0] - center[0])
-                end_angle = math.atan2(end_pos[1] - center[1], end_pos[0] - center[0])
-                
-                # Ensure we draw the arc in the correct direction
-                if direction == 1:  # Clockwise
-                    if end_angle > start_angle:
-                        end_angle -= 2 * math.pi
-                else:  # Counter-clockwise
-                    if start_angle > end_angle:
-                        start_angle -= 2 * math.pi
-                
-                # We don't draw arcs between nodes anymore - the plain circles are sufficient
-                
-                # Draw direction triangle at the midpoint of the arc
-                if direction == 1:  # Clockwise
-                    mid_angle = (start_angle + end_angle) / 2
-                else:  # Counter-clockwise
-                    mid_angle = (end_angle + start_angle) / 2
-                
-                # Calculate position for the triangle
-                mid_point = (center[0] + radius * math.cos(mid_angle), 
-                             center[1] + radius * math.sin(mid_angle))
-                
-                # Calculate direction tangent to the circle (in the direction of movement)
-                if direction == 1:  # Clockwise
-                    dir_angle = mid_angle + math.pi / 2  # Tangent in clockwise direction
-                else:  # Counter-clockwise
-                    dir_angle = mid_angle - math.pi / 2  # Tangent in counter-clockwise direction
-                
-                # Calculate triangle points
-                triangle_size = 5
-                triangle_tip = (mid_point[0] + triangle_size * math.cos(dir_angle),
-                                mid_point[1] + triangle_size * math.sin(dir_angle))
-                
-                side_angle1 = dir_angle + 2.5
-                side_angle2 = dir_angle - 2.5
-                triangle_side1 = (mid_point[0] + triangle_size * math.cos(side_angle1),
-                                  mid_point[1] + triangle_size * math.sin(side_angle1))
-                triangle_side2 = (mid_point[0] + triangle_size * math.cos(side_angle2),
-                                  mid_point[1] + triangle_size * math.sin(side_angle2))
-                
-                # Draw the triangle
-                pygame.draw.polygon(screen, (0, 0, 0), [triangle_tip, triangle_side1, triangle_side2])
+        
+        # Draw the direction triangles between adjacent nodes in the same circle
+        for triangle in self._direction_triangles:
+            pygame.draw.polygon(background, (0, 0, 0), triangle)
         
         # Draw connecting lines between center node and first circle with direction triangles
         center_node = self.center_node
         for node_idx, node in enumerate(self.nodes[1]):  # Nodes in the first circle
             # Draw line
-            start_pos = center_node.get_position()
-            end_pos = node.get_position()
+            start_pos = node_positions[center_node.index]
+            end_pos = node_positions[node.index]
             pygame.draw.line(
-                screen,
+                background,
                 (0, 0, 0),  # Black
                 start_pos,
                 end_pos,
@@ -1167,7 +1284,7 @@ class Board:
             diamond_point4 = (mid_x - diamond_size_short * perp_x, mid_y - diamond_size_short * perp_y)
             
             # Draw the diamond
-            pygame.draw.polygon(screen, (0, 0, 0), [diamond_point1, diamond_point2, diamond_point3, diamond_point4])
+            pygame.draw.polygon(background, (0, 0, 0), [diamond_point1, diamond_point2, diamond_point3, diamond_point4])
         
         # Draw connecting lines between other circles with direction triangles
         for circle_idx in range(1, self.num_circles - 1):
@@ -1178,10 +1295,10 @@ class Board:
                 outer_node = self.nodes[circle_idx + 1][outer_node_idx]
                 
                 # Draw line
-                start_pos = inner_node.get_position()
-                end_pos = outer_node.get_position()
+                start_pos = node_positions[inner_node.index]
+                end_pos = node_positions[outer_node.index]
                 pygame.draw.line(
-                    screen,
+                    background,
                     (0, 0, 0),  # Black
                     start_pos,
                     end_pos,
@@ -1216,107 +1333,195 @@ class Board:
                 diamond_point4 = (mid_x - diamond_size_short * perp_x, mid_y - diamond_size_short * perp_y)
                 
                 # Draw the diamond
-                pygame.draw.polygon(screen, (0, 0, 0), [diamond_point1, diamond_point2, diamond_point3, diamond_point4])
+                pygame.draw.polygon(background, (0, 0, 0), [diamond_point1, diamond_point2, diamond_point3, diamond_point4])
         
         # Draw each node
-        for circle_idx in range(self.num_circles):
-            for node_idx in range(len(self.nodes[circle_idx])):
-                node = self.nodes[circle_idx][node_idx]
-                
-                # Use the same color for all nodes
-                color = self.normal_color
-                
-                # Draw node circle - center node is bigger
-                radius = self.center_node_radius if node == self.center_node else self.node_radius
-                pygame.draw.circle(screen, color, node.get_position(), radius)
-                pygame.draw.circle(screen, (0, 0, 0), node.get_position(), radius, 1)  # Border
+        for node, position in zip(self._flat_nodes, node_positions):
+            # Use the same color for all nodes
+            color = self.normal_color
+            
+            # Draw node circle - center node is bigger
+            radius = self.center_node_radius if node is self.center_node else self.node_radius
+            pygame.draw.circle(background, color, position, radius)
+            pygame.draw.circle(background, (0, 0, 0), position, radius, 1)  # Border
+        
+        # Add text around the outermost circle
+        for char_surface, char_position in self._build_ring_text():
+            background.blit(char_surface, char_position)
+        
+        # Match the display's pixel format for faster blits, once there is one
+        if pygame.display.get_surface() is not None:
+            background = background.convert_alpha()
+        return background
+    
+    def _direction_to_center(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Get the unit vector pointing from a position to the center of the board.
         
-        # Draw fox pieces
-        for fox_node in self.fox_pieces:
-            # Get the current position (either animated or static)
-            x, y = self.get_fox_position(fox_node)
+        Args:
+            x: X coordinate of the position
+            y: Y coordinate of the position
             
-            # Draw fox piece as a red triangle pointing toward the center
-            size = self.node_radius * 0.8
+        Returns:
+            The (dx, dy) unit vector, or (0, 0) at the center itself
+        """
+        dx, dy = self.center_x - x, self.center_y - y
+        
+        # Normalize the vector
+        length = math.sqrt(dx**2 + dy**2)
+        if length > 0:
+            dx, dy = dx/length, dy/length
+        return (dx, dy)
+    
+    def _fox_triangle(self, x: float, y: float) -> List[Tuple[float, float]]:
+        """
+        Get the corners of a fox piece drawn at a position.
+        
+        The fox is a triangle pointing toward the center of the board.
+        
+        Args:
+            x: X coordinate of the piece
+            y: Y coordinate of the piece
             
-            # Calculate vector from this node to the center
-            center_x, center_y = self.center_x, self.center_y
-            dx, dy = center_x - x, center_y - y
+        Returns:
+            The tip and the two base corners of the triangle
+        """
+        size = self.node_radius * 0.8
+        
+        # Unit vector from this position to the center
+        dx, dy = self._direction_to_center(x, y)
+        
+        # Calculate triangle points with the tip pointing toward center
+        tip_x = x + dx * size
+        tip_y = y + dy * size
+        
+        # Calculate perpendicular vector for the base
+        perp_x, perp_y = -dy, dx
+        
+        # Calculate the base points
+        base1_x = x - dx * size/2 + perp_x * size/2
+        base1_y = y - dy * size/2 + perp_y * size/2
+        base2_x = x - dx * size/2 - perp_x * size/2
+        base2_y = y - dy * size/2 - perp_y * size/2
+        
+        return [(tip_x, tip_y), (base1_x, base1_y), (base2_x, base2_y)]
+    
+    def compute_fox_triangle(self, fox_node: BoardNode) -> List[Tuple[float, float]]:
+        """
+        Get the triangle a fox piece is drawn as, wherever it currently is.
+        
+        Args:
+            fox_node: The node of the fox piece
             
-            # Normalize the vector
-            length = math.sqrt(dx**2 + dy**2)
-            if length > 0:
-                dx, dy = dx/length, dy/length
+        Returns:
+            The tip and the two base corners of the triangle
+        """
+        # Resting pieces use the precomputed shape of their node
+        if fox_node in self.fox_animations:
+            return self._fox_triangle(*self.get_fox_position(fox_node))
+        return self._fox_shapes[fox_node.index]
+    
+    def _snake_squiggle(self, x: float, y: float) -> List[Tuple[float, float]]:
+        """
+        Get the points of a snake piece drawn at a position.
+        
+        The snake is a squiggle like in the dice, rotated to face the center
+        of the board.
+        
+        Args:
+            x: X coordinate of the piece
+            y: Y coordinate of the piece
             
-            # Calculate triangle points with the tip pointing toward center
-            tip_x = x + dx * size
-            tip_y = y + dy * size
+        Returns:
+            The points of the squiggle, from tail to head
+        """
+        # Unit vector from this position to the center
+        dx, dy = self._direction_to_center(x, y)
+        
+        # Calculate perpendicular vector for the sine wave
+        perp_x, perp_y = -dy, dx
+        
+        # Build the squiggle as a series of connected points
+        points = []
+        num_segments = len(_SQUIGGLE_WAVE) - 1
+        amplitude = self.node_radius * 0.4
+        squiggle_length = self.node_radius * 1.6
+        
+        # Calculate start and end points along the vector to center
+        start_x = x - dx * squiggle_length/2  # Start away from center
+        start_y = y - dy * squiggle_length/2
+        end_x = x + dx * squiggle_length/2    # End toward center (head)
+        end_y = y + dy * squiggle_length/2
+        
+        for i, wave in enumerate(_SQUIGGLE_WAVE):
+            # Interpolate position along the line from start to end
+            segment_x = start_x + (end_x - start_x) * i / num_segments
+            segment_y = start_y + (end_y - start_y) * i / num_segments
             
-            # Calculate perpendicular vector for the base
-            perp_x, perp_y = -dy, dx
+            # Add sine wave perpendicular to the direction
+            offset_x = amplitude * wave * perp_x
+            offset_y = amplitude * wave * perp_y
             
-            # Calculate the base points
-            base1_x = x - dx * size/2 + perp_x * size/2
-            base1_y = y - dy * size/2 + perp_y * size/2
-            base2_x = x - dx * size/2 - perp_x * size/2
-            base2_y = y - dy * size/2 - perp_y * size/2
+            points.append((segment_x + offset_x, segment_y + offset_y))
+        
+        return points
+    
+    def _draw_pieces(self, surface: pygame.Surface) -> None:
+        """
+        Draw the fox and snake pieces at their current positions.
+        
+        Args:
+            surface: The surface to draw the pieces on
+        """
+        # Draw fox pieces
+        for fox_node in self.fox_pieces:
+            points = self.compute_fox_triangle(fox_node)
             
             # Draw the triangle
-            pygame.draw.polygon(
-                screen, 
-                self.fox_piece_color, 
-                [(tip_x, tip_y), (base1_x, base1_y), (base2_x, base2_y)]
-            )
+            pygame.draw.polygon(surface, self.fox_piece_color, points)
             # Draw border
-            pygame.draw.polygon(
-                screen, 
-                (0, 0, 0), 
-                [(tip_x, tip_y), (base1_x, base1_y), (base2_x, base2_y)],
-                1
-            )
+            pygame.draw.polygon(surface, (0, 0, 0), points, 1)
         
         # Draw snake pieces
         for snake_node in self.snake_pieces:
-            # Get the current position (either animated or static)
-            x, y = self.get_snake_position(snake_node)
-            
-            # Draw snake piece as a green squiggle like in the dice, but rotated to face center
-            
-            # Calculate vector from this node to the center
-            center_x, center_y = self.center_x, self.center_y
-            dx, dy = center_x - x, center_y - y
-            
-            # Normalize the vector
-            length = math.sqrt(dx**2 + dy**2)
-            if length > 0:
-                dx, dy = dx/length, dy/length
-            
-            # Calculate perpendicular vector for the sine wave
-            perp_x, perp_y = -dy, dx
-            
-            # Draw the squiggle as a series of connected points
-            points = []
-            num_segments = 10
-            amplitude = self.node_radius * 0.4
-            squiggle_length = self.node_radius * 1.6
-            
-            # Calculate start and end points along the vector to center
-            start_x = x - dx * squiggle_length/2  # Start away from center
-            start_y = y - dy * squiggle_length/2
-            end_x = x + dx * squiggle_length/2    # End toward center (head)
-            end_y = y + dy * squiggle_length/2
-            
-            for i in range(num_segments + 1):
-                # Interpolate position along the line from start to end
-                segment_x = start_x + (end_x - start_x) * i / num_segments
-                segment_y = start_y + (end_y - start_y) * i / num_segments
-                
-                # Add sine wave perpendicular to the direction
-                offset_x = amplitude * math.sin(i * math.pi / 2) * perp_x
-                offset_y = amplitude * math.sin(i * math.pi / 2) * perp_y
-                
-                points.append((segment_x + offset_x, segment_y + offset_y))
+            # Resting pieces use the precomputed shape of their node
+            if snake_node in self.snake_animations:
+                points = self._snake_squiggle(*self.get_snake_position(snake_node))
+            else:
+                points = self._snake_shapes[snake_node.index]
             
             # Draw the squiggle
-            if len(points) >= 2:
-                pygame.draw.lines(screen, self.snake_piece_color, False, points, 3)
+            pygame.draw.lines(surface, self.snake_piece_color, False, points, 3)
+    
+    def render(self, screen: pygame.Surface) -> None:
+        """
+        Render the board on the screen.
+        
+        While no piece animates, the board and its pieces are kept on a
+        transparent layer that is only redrawn when a piece changes node, so
+        a frame costs a single blit. Only the board's own pixels are cached;
+        whatever the caller drew on the screen beforehand shows through.
+        
+        Args:
+            screen: The pygame surface to render on
+        """
+        # Draw the static board, rebuilding it if the screen size changed
+        if self._background is None or self._background.get_size() != screen.get_size():
+            self._background = self._build_background(screen.get_size())
+            self._board_layer = None
+        
+        # Moving pieces are drawn straight onto the screen every frame
+        if self.fox_animations or self.snake_animations:
+            screen.blit(self._background, (0, 0))
+            self._draw_pieces(screen)
+            return
+        
+        # Redraw the board layer only if a piece is on a different node
+        piece_state = (tuple(node.index for node in self.fox_pieces),
+                       tuple(node.index for node in self.snake_pieces))
+        if self._board_layer is None or self._board_layer_state != piece_state:
+            board_layer = self._background.copy()
+            self._draw_pieces(board_layer)
+            self._board_layer = board_layer
+            self._board_layer_state = piece_state
+        screen.blit(self._board_layer, (0, 0))
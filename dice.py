@@ -5,9 +5,9 @@ import pygame
 import random
 import math
 from typing import List, Tuple
-from enum import Enum
+from enum import Enum, IntEnum
 
-class FaceType(Enum):
+class FaceType(IntEnum):
     """Types of dice faces"""
     BLACK_PIP = 0
     RED_TRIANGLE = 1
@@ -19,6 +19,19 @@ class GameMode(Enum):
     MEDIUM = 1  # Black pip: 1/3, Red triangle: 1/3, Green squiggle: 1/3
     HARD = 2    # Black pip: 1/6, Red triangle: 5/12, Green squiggle: 5/12
 
+# Dice faces in FaceType order, for sampling
+_FACES = (FaceType.BLACK_PIP, FaceType.RED_TRIANGLE, FaceType.GREEN_SQUIGGLE)
+
+# Cumulative face weights for each game mode, in twelfths and in _FACES order
+_FACE_CUM_WEIGHTS = {
+    GameMode.EASY: (6, 9, 12),    # 1/2, 1/4, 1/4
+    GameMode.MEDIUM: (4, 8, 12),  # 1/3 each
+    GameMode.HARD: (2, 7, 12),    # 1/6, 5/12, 5/12
+}
+
+# Sine-wave pattern of the green squiggle, one value per segment point
+_SQUIGGLE_WAVE = tuple(math.sin(i * math.pi / 2) for i in range(11))
+
 class Dice:
     """
     Represents a set of six dice for the Snakes and Foxes game.
@@ -37,17 +50,32 @@ class Dice:
             game_mode: The game difficulty mode that determines dice probabilities
         """
         self.num_dice = 6  # Number of dice
-        self.dice_values = [FaceType.BLACK_PIP] * self.num_dice  # Current displayed values
+        self.dice_values = [FaceType.BLACK_PIP] * self.num_dice  # Current displayed values, updated in place
         self.final_values = [FaceType.BLACK_PIP] * self.num_dice  # Final values after roll
         self.size = 60  # Size of each die square
         self.spacing = 10  # Spacing between dice
         self.color = (255, 255, 255)  # White background
         self.game_mode = game_mode  # Game difficulty mode
         
+        # Top-left offset of each die within the layout (2 rows of 3 dice)
+        dice_per_row = 3
+        step = self.size + self.spacing
+        self._die_offsets = [((i % dice_per_row) * step, (i // dice_per_row) * step)
+                             for i in range(self.num_dice)]
+        
         # Animation properties
         self.is_rolling = False
         self.roll_frames = 0
         self.roll_duration = 10  # Frames
+        self._roll_faces = []  # Faces shown during the roll animation, one row of dice per frame
+        
+        # Pre-rendered die faces and dice grid background, built on first render
+        self._face_surfaces = None
+        self._grid_surface = None
+        
+        # Dice panel as last rendered, redrawn only when the shown faces change
+        self._panel = None
+        self._panel_values = None
     
     def roll(self) -> List[FaceType]:
         """
@@ -56,66 +84,29 @@ class Dice:
         Returns:
             List of dice values.
         """
-        self.final_values = []
+        # Roll all dice in a single weighted sampling call
+        self.final_values = random.choices(_FACES, cum_weights=_FACE_CUM_WEIGHTS[self.game_mode], k=self.num_dice)
+        
+        # Draw the faces for every animation frame up front (equal probability for visual effect)
+        self._roll_faces = random.choices(_FACES, k=(self.roll_duration - 1) * self.num_dice)
         
-        # Roll each die with probabilities based on game mode
-        for _ in range(self.num_dice):
-            face = self._roll_single_die()
-            self.final_values.append(face)
-            
         self.is_rolling = True
         self.roll_frames = 0
         return self.final_values  # Return the final values for counting
     
-    def _roll_single_die(self) -> FaceType:
-        """
-        Roll a single die with probabilities based on game mode.
-        
-        Returns:
-            The face value of the die.
-        """
-        # Generate a random number between 0 and 11 (for finest probability control)
-        roll = random.randint(0, 11)
-        
-        if self.game_mode == GameMode.EASY:
-            # EASY: Black pip (1/2), Red triangle (1/4), Green squiggle (1/4)
-            if roll < 6:  # 0-5 (6/12 = 1/2)
-                return FaceType.BLACK_PIP
-            elif roll < 9:  # 6-8 (3/12 = 1/4)
-                return FaceType.RED_TRIANGLE
-            else:  # 9-11 (3/12 = 1/4)
-                return FaceType.GREEN_SQUIGGLE
-                
-        elif self.game_mode == GameMode.MEDIUM:
-            # MEDIUM: Equal probability (1/3) for each face
-            if roll < 4:  # 0-3 (4/12 = 1/3)
-                return FaceType.BLACK_PIP
-            elif roll < 8:  # 4-7 (4/12 = 1/3)
-                return FaceType.RED_TRIANGLE
-            else:  # 8-11 (4/12 = 1/3)
-                return FaceType.GREEN_SQUIGGLE
-                
-        else:  # GameMode.HARD
-            # HARD: Black pip (1/6), Red triangle (5/12), Green squiggle (5/12)
-            if roll < 2:  # 0-1 (2/12 = 1/6)
-                return FaceType.BLACK_PIP
-            elif roll < 7:  # 2-6 (5/12)
-                return FaceType.RED_TRIANGLE
-            else:  # 7-11 (5/12)
-                return FaceType.GREEN_SQUIGGLE
-    
     def update(self) -> None:
         """Update the dice animation if they're rolling."""
         if self.is_rolling:
             self.roll_frames += 1
             if self.roll_frames < self.roll_duration:
-                # Show random values during animation (equal probability for visual effect)
-                self.dice_values = [random.choice(list(FaceType)) for _ in range(self.num_dice)]
+                # Show this frame's random values during animation
+                start = (self.roll_frames - 1) * self.num_dice
+                self.dice_values[:] = self._roll_faces[start:start + self.num_dice]
             else:
                 # End of animation
                 self.is_rolling = False
-                # Restore the final values
-                self.dice_values = self.final_values.copy()
+                # Show the final values
+                self.dice_values[:] = self.final_values
     
     def set_game_mode(self, mode: GameMode) -> None:
         """
@@ -163,13 +154,44 @@ class Dice:
         for i in range(num_segments + 1):
             segment_y = start_y + (end_y - start_y) * i / num_segments
             # Sine wave pattern
-            offset_x = amplitude * math.sin(i * math.pi / 2)
+            offset_x = amplitude * _SQUIGGLE_WAVE[i]
             points.append((center_x + offset_x, segment_y))
         
         # Draw the squiggle
         if len(points) >= 2:
             pygame.draw.lines(screen, (0, 200, 0), False, points, 3)
     
+    def _build_face_surfaces(self) -> List[pygame.Surface]:
+        """
+        Draw every face once onto its own transparent die-sized surface.
+        
+        Returns:
+            List of face surfaces, indexed by face type value
+        """
+        face_surfaces = []
+        for draw_face in (self._draw_black_pip, self._draw_red_triangle, self._draw_green_squiggle):
+            face_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            draw_face(face_surface, 0, 0)
+            face_surfaces.append(face_surface)
+        return face_surfaces
+    
+    def _build_grid_surface(self) -> pygame.Surface:
+        """
+        Draw the bordered backgrounds of all six dice onto one transparent surface.
+        
+        Returns:
+            Surface holding the 2x3 grid of blank dice
+        """
+        grid_width = max(offset_x for offset_x, _ in self._die_offsets) + self.size
+        grid_height = max(offset_y for _, offset_y in self._die_offsets) + self.size
+        grid_surface = pygame.Surface((grid_width, grid_height), pygame.SRCALPHA)
+        
+        for offset_x, offset_y in self._die_offsets:
+            dice_rect = pygame.Rect(offset_x, offset_y, self.size, self.size)
+            pygame.draw.rect(grid_surface, self.color, dice_rect)
+            pygame.draw.rect(grid_surface, (0, 0, 0), dice_rect, 2)  # Border
+        return grid_surface
+    
     def render(self, screen: pygame.Surface, x: int, y: int) -> None:
         """
         Render all six dice on the screen.
@@ -179,30 +201,22 @@ class Dice:
             x: The x-coordinate for the top-left of the first die.
             y: The y-coordinate for the top-left of the first die.
         """
-        # Update animation if rolling
-        self.update()
-        
-        # Calculate layout (2 rows of 3 dice)
-        dice_per_row = 3
-        
-        # Draw each die
-        for i, value in enumerate(self.dice_values):
-            # Calculate position
-            row = i // dice_per_row
-            col = i % dice_per_row
-            
-            die_x = x + col * (self.size + self.spacing)
-            die_y = y + row * (self.size + self.spacing)
+        # The faces and die backgrounds never change, so they are drawn once and blitted
+        if self._face_surfaces is None:
+            self._face_surfaces = self._build_face_surfaces()
+            self._grid_surface = self._build_grid_surface()
+        
+        # Redraw the panel only when the shown faces differ from the last render
+        if self.dice_values != self._panel_values:
+            panel = self._grid_surface.copy()
+            face_surfaces = self._face_surfaces
             
-            # Draw die background
-            dice_rect = pygame.Rect(die_x, die_y, self.size, self.size)
-            pygame.draw.rect(screen, self.color, dice_rect)
-            pygame.draw.rect(screen, (0, 0, 0), dice_rect, 2)  # Border
+            # Draw each face at its die's precomputed offset
+            for offset, value in zip(self._die_offsets, self.dice_values):
+                panel.blit(face_surfaces[value], offset)
             
-            # Draw the appropriate face
-            if value == FaceType.BLACK_PIP:
-                self._draw_black_pip(screen, die_x, die_y)
-            elif value == FaceType.RED_TRIANGLE:
-                self._draw_red_triangle(screen, die_x, die_y)
-            elif value == FaceType.GREEN_SQUIGGLE:
-                self._draw_green_squiggle(screen, die_x, die_y)
+            self._panel = panel
+            self._panel_values = list(self.dice_values)
+        
+        # Draw the whole dice panel in one go
+        screen.blit(self._panel, (x, y))
@@ -2,7 +2,6 @@
 Game Engine for Snakes and Foxes
 """
 import pygame
-import math
 from typing import Optional, Tuple, List, Dict
 from board import Board, BoardNode
 from player import Player
@@ -15,18 +14,19 @@ class Game:
     This class coordinates all game components and handles the game loop.
     """
     
-    def __init__(self, num_circles: int = 6, nodes_per_circle: int = 10):
+    def __init__(self, num_circles: int = 6, nodes_per_circle: int = 10, vsync: bool = False):
         """
         Initialize the game with all necessary components.
         
         Args:
             num_circles: Number of concentric circles on the board
             nodes_per_circle: Number of nodes per circle
+            vsync: Whether to synchronize display flips with the monitor refresh
         """
         # Set up the display
         self.width = 1800  # 50% wider (1200 * 1.5 = 1800)
         self.height = 1000  # Increased height
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        self.screen = self._create_display(vsync)
         pygame.display.set_caption("Snakes and Foxes")
         
         # Game mode selection
@@ -41,6 +41,15 @@ class Game:
         self.current_player = self.player1  # Start with player 1
         self.dice = Dice(game_mode=self.game_mode)
         
+        # Dice position and the anchors of the status text below the dice
+        self.dice_x = self.width - 300
+        self.dice_y = 50
+        dice_center_x = self.dice_x + (self.dice.size * 1.5) + (self.dice.spacing * 0.5)
+        dice_bottom_y = self.dice_y + (self.dice.size * 2) + self.dice.spacing + 20  # Add some padding
+        self._status_center = (dice_center_x, dice_bottom_y)
+        self._turn_center = (dice_center_x, dice_bottom_y + 40)
+        self._moves_center = (dice_center_x, dice_bottom_y + 80)
+        
         # Initialize player pieces list in the board
         self.update_player_pieces()
         
@@ -52,23 +61,117 @@ class Game:
         self.selected_move = None
         self.moves_remaining = 0  # Number of moves remaining after dice roll
         
+        # Face counts of the last dice roll
+        self.black_pips = 0
+        self.red_triangles = 0
+        self.green_squiggles = 0
+        
+        # Status messages shown below the dice
+        self.show_no_pips_message = False
+        self.show_capture_message = False
+        self.capture_message = ""
+        self.message_timer = 0  # Frames left to show the current message
+        
         # Fox and snake movement variables
-        self.fox_movement_active = False
-        self.snake_movement_active = False
-        self.fox_movement_timer = 0
-        self.snake_movement_timer = 0
+        self.mover: Optional[str] = None  # "Foxes" or "Snakes" while they move, else None
+        self.move_queue: List[BoardNode] = []  # Pieces of the mover to move (in order)
+        self.move_index = 0  # Index of the next piece in the queue to move
+        self.move_timer = 0  # Frames until the next piece moves
         self.movement_delay = 50  # Frames between movements (increased from 30 to 90)
-        self.foxes_to_move = []  # List of foxes to move (in order)
-        self.snakes_to_move = []  # List of snakes to move (in order)
-        self.current_fox_index = 0  # Index of the current fox being moved
-        self.current_snake_index = 0  # Index of the current snake being moved
         
         # Turn tracking
         self.current_turn = "White"  # "White", "Black", "Foxes", or "Snakes"
         
+        # Whether the screen needs to be redrawn
+        self.dirty = True
+        
         # UI elements
         self.font = pygame.font.SysFont(None, 36)
+        self.large_font = pygame.font.SysFont(None, 72)  # Titles and game over text
+        self.mode_font = pygame.font.SysFont(None, 28)  # Current game mode label
+        self.button_font = pygame.font.SysFont(None, 48)  # Mode selection buttons
+        self.description_font = pygame.font.SysFont(None, 24)  # Mode descriptions
+        
+        # Rendered text surfaces by (font, text, color); the game only ever shows
+        # a small set of strings, so each is rasterized once and reused
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Status strings by the value they show, so render does not format them every frame
+        self._turn_labels = {turn: f"{turn}'s turn" for turn in ("White", "Black", "Foxes", "Snakes")}
+        self._mode_labels = {mode: f"Game Mode: {mode.name}" for mode in GameMode}
+        self._moves_labels: Dict[int, str] = {}
+        
+        # Rings around the current player's valid moves, redrawn only when the moves change
+        self._highlight_moves: Optional[List[BoardNode]] = None
+        self._highlight_surface: Optional[pygame.Surface] = None
+        self._highlight_pos = (0, 0)
+        
+    def _create_display(self, vsync: bool) -> pygame.Surface:
+        """
+        Open the game window.
+        
+        VSync is off by default, so a flip never blocks waiting for the
+        vertical blank. pygame can only honour a VSync request through a
+        hardware renderer, which it creates for scaled displays; if none is
+        available the window opens without VSync.
+        
+        Args:
+            vsync: Whether to synchronize display flips with the monitor refresh
+            
+        Returns:
+            The display surface
+        """
+        size = (self.width, self.height)
+        if vsync:
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error:
+                pass
+        return pygame.display.set_mode(size, vsync=0)
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get the antialiased surface for a string, rendering it only the first time.
         
+        Args:
+            font: The font to render with
+            text: The string to render
+            color: The text color
+            
+        Returns:
+            The rendered text surface
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
+    @property
+    def fox_movement_active(self) -> bool:
+        """Whether the foxes are currently moving."""
+        return self.mover == "Foxes"
+    
+    @fox_movement_active.setter
+    def fox_movement_active(self, active: bool):
+        if active:
+            self.mover = "Foxes"
+        elif self.mover == "Foxes":
+            self.mover = None
+    
+    @property
+    def snake_movement_active(self) -> bool:
+        """Whether the snakes are currently moving."""
+        return self.mover == "Snakes"
+    
+    @snake_movement_active.setter
+    def snake_movement_active(self, active: bool):
+        if active:
+            self.mover = "Snakes"
+        elif self.mover == "Snakes":
+            self.mover = None
+    
     def handle_event(self, event):
         """
         Handle pygame events.
@@ -76,6 +179,9 @@ class Game:
         Args:
             event: The pygame event to handle.
         """
+        # Any event may change what is shown
+        self.dirty = True
+        
         # Handle game mode selection screen
         if self.mode_selection_active:
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -148,21 +254,25 @@ class Game:
         # First check the center node (special case)
         center_node = self.board.center_node
         center_x, center_y = center_node.get_position()
-        distance = math.sqrt((center_x - x) ** 2 + (center_y - y) ** 2)
-        if distance <= self.board.center_node_radius:
+        if (center_x - x) ** 2 + (center_y - y) ** 2 <= self.board._center_node_radius_sq:
             return center_node
         
-        # Check all other nodes
-        for circle_idx in range(1, self.board.num_circles):  # Start from circle 1 (not center)
-            for node in self.board.nodes[circle_idx]:
-                node_x, node_y = node.get_position()
-                
-                # Calculate distance from click to node center
-                distance = math.sqrt((node_x - x) ** 2 + (node_y - y) ** 2)
-                
-                # If click is within node radius, return this node
-                if distance <= self.board.node_radius:
-                    return node
+        # Check the nodes in the grid cells around the click; nodes do not
+        # overlap, so at most one of them can contain it
+        board = self.board
+        node_radius_sq = board._node_radius_sq
+        node_positions = board._node_positions
+        node_grid = board._node_grid
+        cell_x = x // board._node_grid_cell
+        cell_y = y // board._node_grid_cell
+        for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+            for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                for index in node_grid.get((grid_x, grid_y), ()):
+                    node_x, node_y = node_positions[index]
+                    
+                    # If click is within node radius, return this node
+                    if (node_x - x) ** 2 + (node_y - y) ** 2 <= node_radius_sq:
+                        return board._flat_nodes[index]
         
         return None
     
@@ -172,7 +282,7 @@ class Game:
         # This ensures that the previous node from one turn doesn't affect the next turn
         self.current_player.previous_node = None
         
-        if self.current_player == self.player1:
+        if self.current_player is self.player1:
             # Switch to player 2 only if they are active
             if self.player2.active:
                 self.current_player = self.player2
@@ -273,31 +383,22 @@ class Game:
         self.moves_remaining = 0  # Reset moves remaining
         
         # Reset dice-related variables
-        if hasattr(self, 'black_pips'):
-            self.black_pips = 0
-        if hasattr(self, 'red_triangles'):
-            self.red_triangles = 0
-        if hasattr(self, 'green_squiggles'):
-            self.green_squiggles = 0
+        self.black_pips = 0
+        self.red_triangles = 0
+        self.green_squiggles = 0
         
         # Reset fox and snake movement variables
-        self.fox_movement_active = False
-        self.snake_movement_active = False
-        self.fox_movement_timer = 0
-        self.snake_movement_timer = 0
-        self.foxes_to_move = []
-        self.snakes_to_move = []
-        self.current_fox_index = 0
-        self.current_snake_index = 0
+        self.mover = None
+        self.move_queue = []
+        self.move_index = 0
+        self.move_timer = 0
         
         # Reset turn tracking
         self.current_turn = "White"
         
         # Reset message flags
-        if hasattr(self, 'show_no_pips_message'):
-            self.show_no_pips_message = False
-        if hasattr(self, 'show_capture_message'):
-            self.show_capture_message = False
+        self.show_no_pips_message = False
+        self.show_capture_message = False
         
         # Reset snakes and foxes to their initial positions
         self.board.fox_pieces = []
@@ -311,16 +412,13 @@ class Game:
     def activate_fox_movement(self):
         """Activate fox movement toward the current player."""
         # Find the closest foxes to the current player
-        self.foxes_to_move = self.board.find_closest_foxes(self.current_player.current_node)
+        foxes_to_move = self.board.find_closest_foxes(self.current_player.current_node)
         
         # Limit the number of foxes to move based on the number of red triangles rolled
-        self.foxes_to_move = self.foxes_to_move[:self.red_triangles]
+        foxes_to_move = foxes_to_move[:self.red_triangles]
         
-        if self.foxes_to_move:
-            self.fox_movement_active = True
-            self.fox_movement_timer = self.movement_delay
-            self.current_fox_index = 0
-            self.current_turn = "Foxes"
+        if foxes_to_move:
+            self.start_movement("Foxes", foxes_to_move)
         else:
             # No foxes to move, check if we should activate snake movement
             if self.green_squiggles > 0:
@@ -333,187 +431,139 @@ class Game:
     def activate_snake_movement(self):
         """Activate snake movement toward the current player."""
         # Find the closest snakes to the current player
-        self.snakes_to_move = self.board.find_closest_snakes(self.current_player.current_node)
+        snakes_to_move = self.board.find_closest_snakes(self.current_player.current_node)
         
         # Limit the number of snakes to move based on the number of green squiggles rolled
-        self.snakes_to_move = self.snakes_to_move[:self.green_squiggles]
+        snakes_to_move = snakes_to_move[:self.green_squiggles]
         
-        if self.snakes_to_move:
-            self.snake_movement_active = True
-            self.snake_movement_timer = self.movement_delay
-            self.current_snake_index = 0
-            self.current_turn = "Snakes"
+        if snakes_to_move:
+            self.start_movement("Snakes", snakes_to_move)
         else:
             # No snakes to move, switch to the other player
             self.dice_rolled = False
             self.switch_player()
     
-    def move_next_fox(self):
-        """Move the next fox in the queue toward the current player."""
-        if self.current_fox_index < len(self.foxes_to_move):
-            fox_node = self.foxes_to_move[self.current_fox_index]
+    def _capture_players(self, new_node: BoardNode, player_node: BoardNode):
+        """
+        Capture the player pieces on the node a fox or snake just moved to.
+        
+        Landing on the current player captures their piece; landing on the
+        center node captures every player resting there.
+        
+        Args:
+            new_node: The node the fox or snake moved to
+            player_node: The current player's node before the move
+        """
+        if new_node is player_node:
+            captured_players = [self.current_player]
+            location = ""
+        elif new_node is self.board.center_node:
+            captured_players = [player for player in (self.player1, self.player2)
+                                if player.active and player.current_node is new_node]
+            location = " on the center"
+        else:
+            return
+        
+        if not captured_players:
+            return
+        
+        for player in captured_players:
+            all_pieces_lost = player.lose_piece()
             
-            # Store the player's current position before moving the fox
-            player_node = self.current_player.current_node
+            # If the current player lost all pieces, the game is over
+            if all_pieces_lost and player is self.current_player:
+                self.game_over = True
+                self.winner = None  # No winner (player lost)
+        
+        # Update player pieces list in the board
+        self.update_player_pieces()
+        
+        # Display one message naming every captured piece
+        owners = " and ".join(f"Player {player.player_num}'s" for player in captured_players)
+        pieces = "pieces" if len(captured_players) > 1 else "piece"
+        self.show_capture_message = True
+        self.capture_message = f"{self.current_turn} captured {owners} {pieces}{location}!"
+        self.message_timer = 45  # Show message for 45 frames
+    
+    def start_movement(self, mover: str, pieces: List[BoardNode]):
+        """
+        Start moving foxes or snakes toward the current player, one per delay.
+        
+        Args:
+            mover: "Foxes" or "Snakes"
+            pieces: The pieces to move, in order
+        """
+        self.mover = mover
+        self.move_queue = pieces
+        self.move_index = 0
+        self.move_timer = self.movement_delay
+        self.current_turn = mover
+        self.dirty = True
+    
+    def move_next_piece(self):
+        """Move the next fox or snake in the queue toward the current player."""
+        # A piece moves or the turn passes on, either way the screen changes
+        self.dirty = True
+        
+        if self.move_index < len(self.move_queue):
+            piece_node = self.move_queue[self.move_index]
             
-            # Move the fox toward the player
-            new_fox_node = self.board.move_fox_toward_player(fox_node, player_node)
+            # Store the player's current position before moving the piece
+            player_node = self.current_player.current_node
             
-            # Check if the fox landed on the player
-            if (new_fox_node.x == player_node.x and 
-                new_fox_node.y == player_node.y):
-                # Fox captured a player piece
-                all_pieces_lost = self.current_player.lose_piece()
-                
-                # Update player pieces list in the board
-                self.update_player_pieces()
-                
-                # Display a message about the capture
-                self.show_capture_message = True
-                self.capture_message = f"{self.current_turn} captured a {self.current_player.player_num} piece!"
-                self.message_timer = 45  # Show message for 90 frames (about 1.5 seconds)
-                
-                # If all pieces are lost, player loses
-                if all_pieces_lost:
-                    self.game_over = True
-                    self.winner = None  # No winner (player lost)
+            # Move the piece toward the player
+            if self.mover == "Foxes":
+                new_node = self.board.move_fox_toward_player(piece_node, player_node)
+            else:
+                new_node = self.board.move_snake_toward_player(piece_node, player_node)
             
-            # Check if the fox landed on the center node
-            elif new_fox_node == self.board.center_node:
-                # Fox captures all players on the center node
-                players_captured = False
-                
-                # Check if player 1 is on the center node
-                if self.player1.active and self.player1.current_node == self.board.center_node:
-                    all_pieces_lost_p1 = self.player1.lose_piece()
-                    players_captured = True
-                    
-                    # Display a message about the capture
-                    self.show_capture_message = True
-                    self.capture_message = f"{self.current_turn} captured a 1 piece in the center!"
-                    self.message_timer = 45  # Show message for 90 frames (about 1.5 seconds)
-                    
-                    # If all pieces are lost, player loses
-                    if all_pieces_lost_p1 and self.current_player == self.player1:
-                        self.game_over = True
-                        self.winner = None  # No winner (player lost)
-                
-                # Check if player 2 is on the center node
-                if self.player2.active and self.player2.current_node == self.board.center_node:
-                    all_pieces_lost_p2 = self.player2.lose_piece()
-                    players_captured = True
-                    
-                    # Display a message about the capture
-                    self.show_capture_message = True
-                    self.capture_message = f"{self.current_turn} captured a 2 piece in the center!"
-                    self.message_timer = 45  # Show message for 45 frames (about 1.5 seconds)
-                    
-                    # If all pieces are lost, player loses
-                    if all_pieces_lost_p2 and self.current_player == self.player2:
-                        self.game_over = True
-                        self.winner = None  # No winner (player lost)
-                
-                # Update player pieces list in the board
-                if players_captured:
-                    self.update_player_pieces()
+            # Capture any player pieces the piece landed on
+            self._capture_players(new_node, player_node)
             
-            # Move to the next fox
-            self.current_fox_index += 1
+            # Move to the next piece
+            self.move_index += 1
             
-            # Reset the timer for the next fox
-            self.fox_movement_timer = self.movement_delay
+            # Reset the timer for the next piece
+            self.move_timer = self.movement_delay
         else:
-            # All foxes have moved, check if we should activate snake movement
-            self.fox_movement_active = False
-            if self.green_squiggles > 0:
+            # All pieces have moved; after the foxes, check if the snakes move
+            finished_mover = self.mover
+            self.mover = None
+            if finished_mover == "Foxes" and self.green_squiggles > 0:
                 self.activate_snake_movement()
             else:
                 # No snakes to move, switch to the other player
                 self.dice_rolled = False
                 self.switch_player()
     
-    def move_next_snake(self):
-        """Move the next snake in the queue toward the current player."""
-        if self.current_snake_index < len(self.snakes_to_move):
-            snake_node = self.snakes_to_move[self.current_snake_index]
-            
-            # Store the player's current position before moving the snake
-            player_node = self.current_player.current_node
-            
-            # Move the snake toward the player
-            new_snake_node = self.board.move_snake_toward_player(snake_node, player_node)
-            
-            # Check if the snake landed on the player
-            if (new_snake_node.x == player_node.x and 
-                new_snake_node.y == player_node.y):
-                # Snake captured a player piece
-                all_pieces_lost = self.current_player.lose_piece()
-                
-                # Update player pieces list in the board
-                self.update_player_pieces()
-                
-                # Display a message about the capture
-                self.show_capture_message = True
-                self.capture_message = f"{self.current_turn} captured a {self.current_player.player_num} piece!"
-                self.message_timer = 45  # Show message for 45 frames (about 1.5 seconds)
-                
-                # If all pieces are lost, player loses
-                if all_pieces_lost:
-                    self.game_over = True
-                    self.winner = None  # No winner (player lost)
-            
-            # Check if the snake landed on the center node
-            elif new_snake_node == self.board.center_node:
-                # Snake captures all players on the center node
-                players_captured = False
-                
-                # Check if player 1 is on the center node
-                if self.player1.active and self.player1.current_node == self.board.center_node:
-                    all_pieces_lost_p1 = self.player1.lose_piece()
-                    players_captured = True
-                    
-                    # Display a message about the capture
-                    self.show_capture_message = True
-                    self.capture_message = f"{self.current_turn} captured a 1 piece in the center!"
-                    self.message_timer = 45  # Show message for 45 frames (about 1.5 seconds)
-                    
-                    # If all pieces are lost, player loses
-                    if all_pieces_lost_p1 and self.current_player == self.player1:
-                        self.game_over = True
-                        self.winner = None  # No winner (player lost)
-                
-                # Check if player 2 is on the center node
-                if self.player2.active and self.player2.current_node == self.board.center_node:
-                    all_pieces_lost_p2 = self.player2.lose_piece()
-                    players_captured = True
-                    
-                    # Display a message about the capture
-                    self.show_capture_message = True
-                    self.capture_message = f"{self.current_turn} captured a 2 piece in the center!"
-                    self.message_timer = 45  # Show message for 45 frames (about 1.5 seconds)
-                    
-                    # If all pieces are lost, player loses
-                    if all_pieces_lost_p2 and self.current_player == self.player2:
-                        self.game_over = True
-                        self.winner = None  # No winner (player lost)
-                
-                # Update player pieces list in the board
-                if players_captured:
-                    self.update_player_pieces()
-            
-            # Move to the next snake
-            self.current_snake_index += 1
-            
-            # Reset the timer for the next snake
-            self.snake_movement_timer = self.movement_delay
-        else:
-            # All snakes have moved, switch to the other player
-            self.snake_movement_active = False
-            self.dice_rolled = False
-            self.switch_player()
+    def _is_changing_on_screen(self) -> bool:
+        """
+        Check whether the screen changes from one frame to the next on its own.
+        
+        Returns:
+            True while dice or pieces are in motion or a timed message is shown
+        """
+        return (self.dice.is_rolling or self.player1.is_moving or self.player2.is_moving or
+                bool(self.board.fox_animations) or bool(self.board.snake_animations) or
+                self.show_no_pips_message or self.show_capture_message)
+    
+    def is_animating(self) -> bool:
+        """
+        Check whether the game needs to be updated every frame.
+        
+        Returns:
+            True while anything is in motion or foxes or snakes are taking their turn
+        """
+        return self._is_changing_on_screen() or self.mover is not None
     
     def update(self):
         """Update game state."""
+        # Anything in motion changes this frame, including the frame it stops on.
+        # Fox and snake turns mark the frame dirty themselves when a piece moves,
+        # so the delay between pieces does not redraw the screen.
+        if self._is_changing_on_screen():
+            self.dirty = True
+        
         # Update dice animation
         self.dice.update()
         
@@ -525,7 +575,7 @@ class Game:
         self.board.update_animations()
         
         # Handle automatic player switching when no black pips are rolled
-        if hasattr(self, 'show_no_pips_message') and self.show_no_pips_message:
+        if self.show_no_pips_message:
             self.message_timer -= 1
             if self.message_timer <= 0:
                 # Remove the message
@@ -541,17 +591,11 @@ class Game:
                     self.dice_rolled = False
                     self.switch_player()
         
-        # Handle fox movement
-        if self.fox_movement_active and not self.game_over:
-            self.fox_movement_timer -= 1
-            if self.fox_movement_timer <= 0:
-                self.move_next_fox()
-        
-        # Handle snake movement
-        if self.snake_movement_active and not self.game_over:
-            self.snake_movement_timer -= 1
-            if self.snake_movement_timer <= 0:
-                self.move_next_snake()
+        # Handle fox and snake movement
+        if self.mover is not None and not self.game_over:
+            self.move_timer -= 1
+            if self.move_timer <= 0:
+                self.move_next_piece()
     
     def render(self):
         """Render the game to the screen."""
@@ -567,16 +611,12 @@ class Game:
         self.board.render(self.screen)
         
         # Highlight valid move nodes on the board for the current player only
-        if self.dice_rolled and not self.fox_movement_active and not self.snake_movement_active:
-            for node in self.current_player.valid_moves:
-                # Draw a simple circle around valid moves
-                pygame.draw.circle(
-                    self.screen, 
-                    (0, 0, 0),  # Black outline
-                    node.get_position(), 
-                    self.current_player.radius + 5,
-                    2  # Line width
-                )
+        if self.dice_rolled and self.mover is None:
+            valid_moves = self.current_player.valid_moves
+            if valid_moves != self._highlight_moves:
+                self._build_move_highlight(valid_moves)
+            if self._highlight_surface is not None:
+                self.screen.blit(self._highlight_surface, self._highlight_pos)
         
         # Draw both players
         self.player1.render(self.screen)
@@ -584,55 +624,47 @@ class Game:
         
         # Draw game over message
         if self.game_over:
-            font = pygame.font.SysFont(None, 72)
+            font = self.large_font
             
             if self.winner is not None:
                 # Player won the game
-                game_over_text = font.render("You win", True, (0, 128, 0))  # Green for winning
+                game_over_text = self._render_text(font, "You win", (0, 128, 0))  # Green for winning
             else:
                 # Game over without a winner (players captured or max turns reached)
                 if not self.current_player.active:
-                    game_over_text = font.render("Game Over - All pieces captured!", True, (255, 0, 0))
+                    game_over_text = self._render_text(font, "Game Over - All pieces captured!", (255, 0, 0))
                 else:
-                    game_over_text = font.render("Game Over!", True, (255, 0, 0))
+                    game_over_text = self._render_text(font, "Game Over!", (255, 0, 0))
             
             game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
             self.screen.blit(game_over_text, game_over_rect)
             
-            restart_text = font.render("Press R to restart", True, (0, 0, 0))
+            restart_text = self._render_text(font, "Press R to restart", (0, 0, 0))
             restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 50))
             self.screen.blit(restart_text, restart_rect)
         
-        # Calculate dice position
-        dice_x = self.width - 300
-        dice_y = 50
-        
         # Draw the dice
+        dice_x, dice_y = self.dice_x, self.dice_y
         self.dice.render(self.screen, dice_x, dice_y)
         
         # Display current game mode
-        mode_font = pygame.font.SysFont(None, 28)
-        mode_text = f"Game Mode: {self.game_mode.name}"
+        mode_text = self._mode_labels[self.game_mode]
         mode_color = (0, 0, 200)  # Blue
-        mode_surface = mode_font.render(mode_text, True, mode_color)
+        mode_surface = self._render_text(self.mode_font, mode_text, mode_color)
         self.screen.blit(mode_surface, (dice_x, dice_y - 30))
         
-        # Calculate the center position of the dice display
-        dice_center_x = dice_x + (self.dice.size * 1.5) + (self.dice.spacing * 0.5)
-        dice_bottom_y = dice_y + (self.dice.size * 2) + self.dice.spacing + 20  # Add some padding
-        
         # Show "No black pips!" message when applicable
-        if hasattr(self, 'show_no_pips_message') and self.show_no_pips_message:
-            no_pips_text = self.font.render("No black pips! Player's turn skipped...", True, (255, 0, 0))
-            no_pips_rect = no_pips_text.get_rect(center=(dice_center_x, dice_bottom_y))
+        if self.show_no_pips_message:
+            no_pips_text = self._render_text(self.font, "No black pips! Player's turn skipped...", (255, 0, 0))
+            no_pips_rect = no_pips_text.get_rect(center=self._status_center)
             self.screen.blit(no_pips_text, no_pips_rect)
             
         # Show capture message when applicable
-        if hasattr(self, 'show_capture_message') and self.show_capture_message:
+        if self.show_capture_message:
             # Determine message color based on what captured the piece
             message_color = (255, 0, 0) if "Foxes" in self.capture_message else (0, 200, 0)
-            capture_text = self.font.render(self.capture_message, True, message_color)
-            capture_rect = capture_text.get_rect(center=(dice_center_x, dice_bottom_y))
+            capture_text = self._render_text(self.font, self.capture_message, message_color)
+            capture_rect = capture_text.get_rect(center=self._status_center)
             self.screen.blit(capture_text, capture_rect)
             
             # Update message timer in the update method
@@ -643,9 +675,9 @@ class Game:
         # We'll handle all status text in the section below
         
         # Show "Push Space to roll" text when dice haven't been rolled
-        if not self.dice_rolled and not self.fox_movement_active and not self.snake_movement_active:
-            space_text = self.font.render("Push Space to roll", True, (0, 0, 255))
-            space_rect = space_text.get_rect(center=(dice_center_x, dice_bottom_y))
+        if not self.dice_rolled and self.mover is None:
+            space_text = self._render_text(self.font, "Push Space to roll", (0, 0, 255))
+            space_rect = space_text.get_rect(center=self._status_center)
             self.screen.blit(space_text, space_rect)
         
         # Show turn information
@@ -656,42 +688,69 @@ class Game:
             turn_color = (0, 200, 0)  # Green for snakes
         
         # Always display the active player's turn
-        turn_text = self.font.render(
-            f"{self.current_turn}'s turn", 
-            True, 
-            turn_color
-        )
-        turn_rect = turn_text.get_rect(center=(dice_center_x, dice_bottom_y + 40))
+        turn_text = self._render_text(self.font, self._turn_labels[self.current_turn], turn_color)
+        turn_rect = turn_text.get_rect(center=self._turn_center)
         self.screen.blit(turn_text, turn_rect)
         
         # Display moves remaining only after dice are rolled
-        if self.dice_rolled or self.fox_movement_active or self.snake_movement_active:
+        if self.dice_rolled or self.mover is not None:
             # Calculate moves remaining based on current turn
             if self.current_turn == "White" or self.current_turn == "Black":
                 moves_remaining = self.moves_remaining
-            elif self.current_turn == "Foxes":
-                moves_remaining = len(self.foxes_to_move) - self.current_fox_index
-            else:  # Snakes
-                moves_remaining = len(self.snakes_to_move) - self.current_snake_index
+            else:  # Foxes or Snakes
+                moves_remaining = len(self.move_queue) - self.move_index
                 
-            moves_text = self.font.render(
-                f"Moves remaining: {moves_remaining}", 
-                True, 
-                turn_color
-            )
-            moves_rect = moves_text.get_rect(center=(dice_center_x, dice_bottom_y + 80))
+            moves_label = self._moves_labels.get(moves_remaining)
+            if moves_label is None:
+                moves_label = self._moves_labels[moves_remaining] = f"Moves remaining: {moves_remaining}"
+            moves_text = self._render_text(self.font, moves_label, turn_color)
+            moves_rect = moves_text.get_rect(center=self._moves_center)
             self.screen.blit(moves_text, moves_rect)
     
+    def _build_move_highlight(self, valid_moves: List[BoardNode]):
+        """
+        Draw the rings around the valid moves onto one transparent surface.
+        
+        The surface only covers the bounding box of the rings, so blitting it
+        touches no more of the screen than drawing the rings directly.
+        
+        Args:
+            valid_moves: The nodes to highlight
+        """
+        self._highlight_moves = list(valid_moves)
+        self._highlight_surface = None
+        if not valid_moves:
+            return
+        
+        ring_radius = self.current_player.radius + 5
+        positions = [node.get_position() for node in valid_moves]
+        left = min(x for x, _ in positions) - ring_radius
+        top = min(y for _, y in positions) - ring_radius
+        right = max(x for x, _ in positions) + ring_radius
+        bottom = max(y for _, y in positions) + ring_radius
+        
+        surface = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
+        for x, y in positions:
+            # Draw a simple circle around valid moves
+            pygame.draw.circle(
+                surface,
+                (0, 0, 0),  # Black outline
+                (x - left, y - top),
+                ring_radius,
+                2  # Line width
+            )
+        
+        self._highlight_surface = surface
+        self._highlight_pos = (left, top)
+    
     def _render_mode_selection(self):
         """Render the game mode selection screen."""
         # Title
-        title_font = pygame.font.SysFont(None, 72)
-        title_text = title_font.render("Select Game Mode", True, (0, 0, 0))
+        title_text = self._render_text(self.large_font, "Select Game Mode", (0, 0, 0))
         title_rect = title_text.get_rect(center=(self.width // 2, 150))
         self.screen.blit(title_text, title_rect)
         
         # Mode buttons
-        button_font = pygame.font.SysFont(None, 48)
         button_width, button_height = 300, 100
         button_spacing = 50
         button_y_start = 300
@@ -728,12 +787,11 @@ class Game:
             pygame.draw.rect(self.screen, (0, 0, 0), button_rect, 3)  # Border
             
             # Draw button text
-            mode_text = button_font.render(mode.name, True, (0, 0, 0))
+            mode_text = self._render_text(self.button_font, mode.name, (0, 0, 0))
             mode_rect = mode_text.get_rect(center=button_rect.center)
             self.screen.blit(mode_text, mode_rect)
             
             # Draw description text
-            desc_font = pygame.font.SysFont(None, 24)
-            desc_text = desc_font.render(mode_descriptions[mode], True, (0, 0, 0))
+            desc_text = self._render_text(self.description_font, mode_descriptions[mode], (0, 0, 0))
             desc_rect = desc_text.get_rect(center=(self.width // 2, button_y + button_height + 25))
             self.screen.blit(desc_text, desc_rect)
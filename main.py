@@ -22,6 +22,8 @@ def parse_arguments():
                         help='Number of concentric circles on the board (default: 6)')
     parser.add_argument('--nodes', type=int, default=10,
                         help='Number of nodes per circle (default: 10)')
+    parser.add_argument('--vsync', action='store_true',
+                        help='Synchronize frames with the monitor refresh (default: off)')
     
     return parser.parse_args()
 
@@ -35,15 +37,29 @@ def main():
     # Initialize pygame
     pygame.init()
     
+    # Only queue the events the game handles, so mouse motion and most window
+    # events are not turned into Python objects every frame. Exposure events
+    # are kept so an idle window is redrawn when it is uncovered.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED])
+    
     # Create game instance with customizable parameters
-    game = Game(num_circles=args.circles, nodes_per_circle=args.nodes)
+    game = Game(num_circles=args.circles, nodes_per_circle=args.nodes, vsync=args.vsync)
     
     # Create a clock for controlling frame rate
     clock = pygame.time.Clock()
     
     # Main game loop
     while True:
-        for event in pygame.event.get():
+        if game.dirty or game.is_animating():
+            events = pygame.event.get()
+        else:
+            # Nothing is moving: let the process sleep until an event arrives
+            # (or a frame's time passes), then drain anything queued behind it
+            event = pygame.event.wait(timeout=16)
+            events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -54,11 +70,11 @@ def main():
         # Update game state
         game.update()
         
-        # Render the game
-        game.render()
-        
-        # Update the display
-        pygame.display.flip()
+        # Render the game and update the display, only when something changed
+        if game.dirty:
+            game.render()
+            pygame.display.flip()
+            game.dirty = False
         
         # Cap the frame rate
         clock.tick(60)
@@ -4,7 +4,7 @@ Player module for Snakes and Foxes game
 import pygame
 import math
 from typing import Tuple, List, Optional
-from board import BoardNode, Board
+from board import BoardNode, Board, _ANIMATION_PATH_POINTS
 
 class Player:
     """
@@ -14,6 +14,15 @@ class Player:
     Each player has two pieces that can be captured by foxes.
     """
     
+    # Number of points in every animation path, straight or arc
+    PATH_POINTS = _ANIMATION_PATH_POINTS + 1
+    
+    # Distance a moving player covers per frame, in pixels, and the bounds on
+    # the resulting progress increment so no move is a blink or a crawl
+    MOVE_PIXELS_PER_FRAME = 8
+    MIN_MOVE_SPEED = 0.03
+    MAX_MOVE_SPEED = 0.15
+    
     def __init__(self, board: Board, player_num: int = 1):
         """
         Initialize the player at the starting position.
@@ -35,12 +44,26 @@ class Player:
             
         self.radius = 10
         
+        # Sideways offset on the shared center node, so both players stay visible
+        self._center_offset = -15 if player_num == 1 else 15
+        
+        # Pre-rendered token, built on first render
+        self._token_surface = None
+        
+        # Resting position on the board and the node it was computed for
+        self._cached_pos = None
+        self._cached_pos_node = None
+        
         # Game state
         self.turn_count = 0
         self.has_reached_outer_circle = False
         
-        # Valid moves after dice roll
-        self.valid_moves = []
+        # Valid moves after dice roll, in order, and the same nodes as a set
+        # for membership checks. After a move they are marked stale and only
+        # recomputed when next read.
+        self._valid_moves = []
+        self._valid_move_set = set()
+        self._valid_moves_stale = False
         
         # Player pieces
         self.pieces = 2  # Start with 2 pieces
@@ -66,9 +89,29 @@ class Player:
         self.has_reached_outer_circle = False
         self.valid_moves = []
         self.is_moving = False
+        self.move_progress = 0
+        self.move_speed = 0.05  # Moves set their own speed; start from the default again
+        self.animation_path = []
+        self.target_node = None
         self.pieces = 2  # Reset to 2 pieces
         self.active = True  # Player is active again
     
+    @property
+    def valid_moves(self) -> List[BoardNode]:
+        """
+        The nodes the player can move to, recomputed from the current node if
+        a move has completed since they were last set.
+        """
+        if self._valid_moves_stale:
+            self.get_connected_nodes()
+        return self._valid_moves
+    
+    @valid_moves.setter
+    def valid_moves(self, moves: List[BoardNode]) -> None:
+        self._valid_moves = moves
+        self._valid_move_set = set(moves)
+        self._valid_moves_stale = False
+    
     def get_valid_moves(self, dice_value: int) -> List[BoardNode]:
         """
         Get valid moves based on the dice roll.
@@ -81,7 +124,7 @@ class Player:
         """
         # Always set is_player=True for player movement
         self.valid_moves = self.board.get_valid_moves(self.current_node, dice_value, is_player=True, previous_node=self.previous_node)
-        return self.valid_moves
+        return self._valid_moves
     
     def get_connected_nodes(self) -> List[BoardNode]:
         """
@@ -92,7 +135,7 @@ class Player:
         """
         # Always set is_player=True for player movement
         self.valid_moves = self.board.get_connected_nodes(self.current_node, is_player=True, previous_node=self.previous_node)
-        return self.valid_moves
+        return self._valid_moves
     
     def move_to_node(self, target_node: BoardNode) -> None:
         """
@@ -102,8 +145,10 @@ class Player:
             target_node: The node to move to
         """
         # Make sure the node is in valid moves or make it valid for testing purposes
-        if target_node not in self.valid_moves:
-            self.valid_moves.append(target_node)
+        valid_moves = self.valid_moves
+        if target_node not in self._valid_move_set:
+            valid_moves.append(target_node)
+            self._valid_move_set.add(target_node)
         
         # Store the current node as the previous node before moving
         self.previous_node = self.current_node
@@ -128,7 +173,7 @@ class Player:
         # Player can win if they've reached any node in the outermost circle
         # and are now back at the center node
         return (self.has_reached_outer_circle and 
-                self.current_node == self.board.center_node)
+                self.current_node is self.board.center_node)
     
     def lose_piece(self) -> bool:
         """
@@ -153,9 +198,9 @@ class Player:
         circle_idx = self.current_node.circle_idx
         node_idx = self.current_node.node_idx
         
-        if self.current_node == self.board.center_node:
+        if self.current_node is self.board.center_node:
             return "Center (Start)"
-        elif self.current_node == self.board.goal_node:
+        elif self.current_node is self.board.goal_node:
             return "Goal"
         else:
             return f"Circle {circle_idx}, Node {node_idx}"
@@ -172,15 +217,17 @@ class Player:
         self.target_node = target_node
         
         # Store start position
-        start_x, start_y = self.current_node.get_position()
-        if self.current_node == self.board.center_node:
-            # Apply offset for center node
-            offset = -15 if self.player_num == 1 else 15
-            start_x += offset
-        self.move_start_pos = (start_x, start_y)
+        self.move_start_pos = self.get_resting_position()
         
         # Calculate the animation path
         self.calculate_animation_path(target_node)
+        
+        # Pace the animation by the path's length, so short hops finish in a
+        # few frames and long arcs keep the same speed on screen
+        path = self.animation_path
+        length = sum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(path, path[1:]))
+        if length > 0:
+            self.move_speed = max(self.MIN_MOVE_SPEED, min(self.MAX_MOVE_SPEED, self.MOVE_PIXELS_PER_FRAME / length))
     
     def calculate_animation_path(self, target_node: BoardNode) -> None:
         """
@@ -210,48 +257,9 @@ class Player:
             start_node: The starting node
             target_node: The target node
         """
-        # Get the center of the board
-        center_x, center_y = self.board.center_x, self.board.center_y
-        
-        # Get the circle radius
-        circle_radius = (start_node.circle_idx + 1) * self.board.circle_spacing
-        
-        # Get start and end positions
-        start_pos = start_node.get_position()
-        end_pos = target_node.get_position()
-        
-        # Calculate node indices
-        start_idx = start_node.node_idx
-        end_idx = target_node.node_idx
-        
-        # Calculate the rotation angle (pi/5 per node as there are 10 nodes in a full rotation)
-        angle_per_node = math.pi / 5
-        
-        # Calculate the number of nodes to rotate (shortest path)
-        nodes_diff = (end_idx - start_idx) % self.board.nodes_per_circle
-        if nodes_diff > self.board.nodes_per_circle / 2:
-            nodes_diff = nodes_diff - self.board.nodes_per_circle
-        
-        # Calculate the total rotation angle
-        rotation_angle = nodes_diff * angle_per_node
-        
-        # Get the starting angle in radians
-        start_vector = pygame.math.Vector2(start_pos[0] - center_x, start_pos[1] - center_y)
-        start_angle_rad = math.atan2(start_vector.y, start_vector.x)
-        
-        # Create points along the arc
-        num_points = 20  # Number of points in the path
-        
-        for i in range(num_points + 1):
-            # Interpolate angle
-            t = i / num_points
-            angle = start_angle_rad + rotation_angle * t
-            
-            # Calculate position
-            x = center_x + circle_radius * math.cos(angle)
-            y = center_y + circle_radius * math.sin(angle)
-            
-            self.animation_path.append((x, y))
+        # Arcs follow the circle between the two nodes, the same path the
+        # board's pieces take, so reuse the board's cached path for the pair
+        self.animation_path = self.board.get_animation_path(start_node, target_node)
     
     def calculate_straight_path(self, start_node: BoardNode, target_node: BoardNode) -> None:
         """
@@ -265,16 +273,13 @@ class Player:
         start_x, start_y = self.move_start_pos
         end_x, end_y = target_node.get_position()
         
-        # Create points along the straight line
-        num_points = 20  # Number of points in the path
-        
-        for i in range(num_points + 1):
-            # Interpolate position
-            t = i / num_points
-            x = start_x + (end_x - start_x) * t
-            y = start_y + (end_y - start_y) * t
-            
-            self.animation_path.append((x, y))
+        # Create points along the straight line, interpolating along its
+        # direction vector in a single pass
+        num_points = self.PATH_POINTS - 1  # Number of segments in the path
+        dx = end_x - start_x
+        dy = end_y - start_y
+        self.animation_path = [(start_x + dx * t, start_y + dy * t)
+                               for t in (i / num_points for i in range(num_points + 1))]
     
     def update(self) -> None:
         """Update the player's animation state."""
@@ -286,31 +291,33 @@ class Player:
             if self.move_progress >= 1:
                 self.is_moving = False
                 
-                # Store the target node before any special effects are applied
-                original_target = self.target_node
+                # Look up the board and its outer circle index once
+                board = self.board
+                outer_circle_idx = board.num_circles - 1
                 
                 # Update position to the target node
-                self.current_node = self.target_node
+                target_node = self.target_node
+                self.current_node = target_node
                 
                 # Check if player has reached the outermost circle and set the flag
-                if self.current_node.circle_idx == self.board.num_circles - 1:
+                on_outer_circle = target_node.circle_idx == outer_circle_idx
+                if on_outer_circle:
                     self.has_reached_outer_circle = True
                 
                 # Apply special effects (snakes or foxes)
-                effect_node = self.board.apply_special_effect(self.current_node)
+                effect_node = board.apply_special_effect(target_node)
                 
                 # Only update the current node if applying a special effect doesn't
                 # move the player from the outer circle to a non-outer circle
-                if not (self.current_node.circle_idx == self.board.num_circles - 1 and 
-                        effect_node.circle_idx != self.board.num_circles - 1):
+                if not (on_outer_circle and effect_node.circle_idx != outer_circle_idx):
                     self.current_node = effect_node
                 
                 # Increment turn count
                 self.turn_count += 1
                 
-                # Update valid moves from the new position
-                # This ensures the player can move again if they have more moves left
-                self.get_connected_nodes()
+                # Valid moves from the new position are recomputed when next read,
+                # so the player can move again if they have more moves left
+                self._valid_moves_stale = True
                 
                 # Clear target node
                 self.target_node = None
@@ -319,6 +326,25 @@ class Player:
                 if self.on_animation_complete:
                     self.on_animation_complete()
     
+    def get_resting_position(self) -> Tuple[int, int]:
+        """
+        Get the player's position on its current node, ignoring any animation.
+        
+        Returns:
+            The (x, y) position, offset sideways on the shared center node
+        """
+        # Recompute only when the player is on a different node than last time
+        if self.current_node is not self._cached_pos_node:
+            x, y = self.current_node.get_position()
+            
+            # Apply offset for center node
+            if self.current_node is self.board.center_node:
+                x += self._center_offset
+            
+            self._cached_pos = (x, y)
+            self._cached_pos_node = self.current_node
+        return self._cached_pos
+    
     def get_current_animated_position(self) -> Tuple[int, int]:
         """
         Get the current position during animation.
@@ -328,21 +354,35 @@ class Player:
         """
         if not self.is_moving or not self.animation_path:
             # If not moving or no path, return the current node position
-            x, y = self.current_node.get_position()
-            
-            # Apply offset for center node
-            if self.current_node == self.board.center_node:
-                offset = -15 if self.player_num == 1 else 15
-                x += offset
-                
-            return (x, y)
+            return self.get_resting_position()
         
-        # Calculate the index in the animation path
-        path_index = min(int(self.move_progress * len(self.animation_path)), len(self.animation_path) - 1)
+        # Calculate the index in the animation path; every path has the same
+        # number of points, so the last index is a constant
+        path_index = int(self.move_progress * Player.PATH_POINTS)
+        if path_index > Player.PATH_POINTS - 1:
+            path_index = Player.PATH_POINTS - 1
         
         # Return the position at that index
         return self.animation_path[path_index]
     
+    def _build_token_surface(self) -> pygame.Surface:
+        """
+        Draw the player's token once onto a transparent surface.
+        
+        Returns:
+            Surface holding the bordered token, centered on the surface
+        """
+        size = 2 * self.radius + 2
+        center = (self.radius + 1, self.radius + 1)
+        token_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(token_surface, self.color, center, self.radius)
+        pygame.draw.circle(token_surface, (0, 0, 0), center, self.radius, 1)  # Border
+        
+        # Match the display's pixel format for faster blits, once there is one
+        if pygame.display.get_surface() is not None:
+            token_surface = token_surface.convert_alpha()
+        return token_surface
+    
     def render(self, screen: pygame.Surface) -> None:
         """
         Render the player on the screen.
@@ -357,6 +397,9 @@ class Player:
         # Get the current position (either animated or static)
         x, y = self.get_current_animated_position()
         
-        # Draw the player as a simple circle without numbers
-        pygame.draw.circle(screen, self.color, (x, y), self.radius)
-        pygame.draw.circle(screen, (0, 0, 0), (x, y), self.radius, 1)  # Border
+        # Draw the player as a simple circle without numbers, blitting the
+        # pre-rendered token; positions truncate to whole pixels as in drawing
+        if self._token_surface is None:
+            self._token_surface = self._build_token_surface()
+        offset = self.radius + 1
+        screen.blit(self._token_surface, (int(x) - offset, int(y) - offset))
@@ -19,16 +19,32 @@ from board import Board, BoardNode
 from player import Player
 from game import Game
 
+@pytest.fixture(scope="module", autouse=True)
+def pygame_display():
+    """Initialize the display and font subsystems once for the module"""
+    # No window is opened, so the dummy driver works on headless machines
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+
+@pytest.fixture(scope="class")
+def board_and_player():
+    """Build the board and player once for a test class"""
+    # Create a board with 6 circles and 10 nodes per circle
+    board = Board(num_circles=6, nodes_per_circle=10)
+    player = Player(board)
+    return board, player
+
 class TestFixedBugs:
     """Tests for verifying bug fixes in the game"""
 
-    def setup_method(self):
-        """Set up the test environment"""
-        pygame.init()
+    @pytest.fixture(autouse=True)
+    def setup_board(self, board_and_player):
+        """Reset the shared board and player before each test"""
+        self.board, self.player = board_and_player
         
-        # Create a board with 6 circles and 10 nodes per circle
-        self.board = Board(num_circles=6, nodes_per_circle=10)
-        self.player = Player(self.board)
+        # Put the player back on the center node with no moves or flags set
+        self.player.reset()
         
         # Clear lists to avoid overlap issues in the test
         self.board.player_pieces = [self.player.current_node]
@@ -37,47 +53,26 @@ class TestFixedBugs:
         self.board.fox_pieces = []
         self.board.snake_pieces = []
     
-    def teardown_method(self):
-        """Clean up after the test"""
-        pygame.quit()
-
-    def test_cannot_move_to_outer_circle_occupied_by_fox(self):
-        """Test that players cannot move to the outer circle when occupied by a fox"""
+    @pytest.mark.parametrize("piece_attr, node_idx", [
+        ("fox_pieces", 0),
+        ("snake_pieces", 2),
+    ], ids=["fox", "snake"])
+    def test_cannot_move_to_outer_circle_occupied(self, piece_attr, node_idx):
+        """Test that players cannot move to the outer circle when occupied by a fox or snake"""
         # Move player to the second-to-last circle (circle 4)
-        second_to_last_circle_node = self.board.get_node(4, 0)
+        second_to_last_circle_node = self.board.get_node(4, node_idx)
         self.player.current_node = second_to_last_circle_node
         self.board.player_pieces = [self.player.current_node]
         
-        # Place a fox piece in the outer circle node directly outward from player
-        outer_node = self.board.get_node(5, 0)  # The node player would move to
-        self.board.fox_pieces = [outer_node]
+        # Place the piece in the outer circle node directly outward from player
+        outer_node = self.board.get_node(5, node_idx)  # The node player would move to
+        setattr(self.board, piece_attr, [outer_node])
         
         # Get valid moves with dice value 1 (allows moving to adjacent circle)
         valid_moves = self.player.get_valid_moves(1)
         
-        # Outer node should not be in valid moves because it's occupied by a fox
-        assert outer_node not in valid_moves, "Player should not be able to move to a node occupied by a fox"
-        
-        # Verify we can move to other directions (within same circle)
-        same_circle_moves = [node for node in valid_moves if node.circle_idx == 4]
-        assert len(same_circle_moves) > 0, "Player should still be able to move within the same circle"
-
-    def test_cannot_move_to_outer_circle_occupied_by_snake(self):
-        """Test that players cannot move to the outer circle when occupied by a snake"""
-        # Move player to the second-to-last circle (circle 4)
-        second_to_last_circle_node = self.board.get_node(4, 2)
-        self.player.current_node = second_to_last_circle_node
-        self.board.player_pieces = [self.player.current_node]
-        
-        # Place a snake piece in the outer circle node directly outward from player
-        outer_node = self.board.get_node(5, 2)  # The node player would move to
-        self.board.snake_pieces = [outer_node]
-        
-        # Get valid moves with dice value 1 (allows moving to adjacent circle)
-        valid_moves = self.player.get_valid_moves(1)
-        
-        # Outer node should not be in valid moves because it's occupied by a snake
-        assert outer_node not in valid_moves, "Player should not be able to move to a node occupied by a snake"
+        # Outer node should not be in valid moves because it's occupied
+        assert outer_node not in valid_moves, f"Player should not be able to move to a node occupied by {piece_attr}"
         
         # Verify we can move to other directions (within same circle)
         same_circle_moves = [node for node in valid_moves if node.circle_idx == 4]
@@ -173,8 +168,9 @@ class TestFixedBugs:
         expected_base2_x = fox_x - dx * size/2 - perp_x * size/2
         expected_base2_y = fox_y - dy * size/2 - perp_y * size/2
         
-        # Create a mock screen to test rendering
-        screen = pygame.Surface((1800, 1000))
+        # Create a mock screen to test rendering; the test board only records
+        # the triangle, so a single pixel is enough
+        screen = pygame.Surface((1, 1))
         
         # Create a subclass of Board to capture the drawing
         class TestBoard(Board):
@@ -251,69 +247,40 @@ class TestFixedBugs:
         fox_node = self.board.get_node(5, 3)
         self.board.fox_pieces = [fox_node]
         
-        # Create a mock function to capture the polygon coordinates
-        original_draw_polygon = pygame.draw.polygon
-        drawn_polygons = []
+        # Get the triangle the fox is drawn as
+        fox_points = self.board.compute_fox_triangle(fox_node)
+        assert len(fox_points) == 3, "Fox should be drawn as a triangle with 3 points"
         
-        def mock_draw_polygon(surface, color, points, width=0):
-            drawn_polygons.append((color, points))
-            return original_draw_polygon(surface, color, points, width)
+        # Get coordinates
+        fox_pos = fox_node.get_position()
+        center_pos = (self.board.center_x, self.board.center_y)
         
-        # Monkey patch pygame.draw.polygon
-        pygame.draw.polygon = mock_draw_polygon
+        # Identify the tip (point closest to center)
+        distances_to_center = []
+        for point in fox_points:
+            dist = math.sqrt((point[0] - center_pos[0])**2 + (point[1] - center_pos[1])**2)
+            distances_to_center.append(dist)
         
-        try:
-            # Create a mock screen and render the board
-            screen = pygame.Surface((1800, 1000))
-            self.board.render(screen)
-            
-            # Find the fox drawing (should be a red triangle)
-            fox_drawing = None
-            for color, points in drawn_polygons:
-                if color == self.board.fox_piece_color:
-                    fox_drawing = points
-                    break
-            
-            assert fox_drawing is not None, "Fox should have been drawn with the fox piece color"
-            
-            # Convert points to a more readable format
-            fox_points = list(fox_drawing)
-            assert len(fox_points) == 3, "Fox should be drawn as a triangle with 3 points"
-            
-            # Get coordinates
-            fox_pos = fox_node.get_position()
-            center_pos = (self.board.center_x, self.board.center_y)
-            
-            # Identify the tip (point closest to center)
-            distances_to_center = []
-            for point in fox_points:
-                dist = math.sqrt((point[0] - center_pos[0])**2 + (point[1] - center_pos[1])**2)
-                distances_to_center.append(dist)
-            
-            tip_index = distances_to_center.index(min(distances_to_center))
-            tip_point = fox_points[tip_index]
-            
-            # Calculate the expected fox triangle orientation
-            fox_x, fox_y = fox_pos
-            center_x, center_y = center_pos
-            
-            # Vector from fox to center
-            dx, dy = center_x - fox_x, center_y - fox_y
-            
-            # Normalize the vector
-            length = math.sqrt(dx**2 + dy**2)
-            if length > 0:
-                dx, dy = dx/length, dy/length
-            
-            # Calculate if tip is in the expected direction
-            # Tip should be closer to center than fox position
-            vector_to_tip = (tip_point[0] - fox_x, tip_point[1] - fox_y)
-            
-            # Calculate dot product to see if vectors point in same direction
-            dot_product = vector_to_tip[0] * dx + vector_to_tip[1] * dy
-            
-            assert dot_product > 0, "Fox triangle tip should point toward the center"
-            
-        finally:
-            # Restore original function
-            pygame.draw.polygon = original_draw_polygon
\ No newline at end of file
+        tip_index = distances_to_center.index(min(distances_to_center))
+        tip_point = fox_points[tip_index]
+        
+        # Calculate the expected fox triangle orientation
+        fox_x, fox_y = fox_pos
+        center_x, center_y = center_pos
+        
+        # Vector from fox to center
+        dx, dy = center_x - fox_x, center_y - fox_y
+        
+        # Normalize the vector
+        length = math.sqrt(dx**2 + dy**2)
+        if length > 0:
+            dx, dy = dx/length, dy/length
+        
+        # Calculate if tip is in the expected direction
+        # Tip should be closer to center than fox position
+        vector_to_tip = (tip_point[0] - fox_x, tip_point[1] - fox_y)
+        
+        # Calculate dot product to see if vectors point in same direction
+        dot_product = vector_to_tip[0] * dx + vector_to_tip[1] * dy
+        
+        assert dot_product > 0, "Fox triangle tip should point toward the center"
\ No newline at end of file
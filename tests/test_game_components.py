@@ -200,6 +200,60 @@ class TestBoard:
         # Check that fox pieces are placed at odd positions (where fox special nodes are)
         for fox_node in board.fox_pieces:
             assert fox_node.node_idx % 2 == 1
+
+    def test_animations_are_per_board(self):
+        """Test that fox and snake animations are not shared between boards"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        other_board = Board(num_circles=6, nodes_per_circle=10)
+
+        # Start an animation on one board only
+        fox_node = board.fox_pieces[0]
+        board.start_piece_animation(fox_node, board.get_node(4, fox_node.node_idx), is_fox=True)
+
+        assert board.fox_animations
+        assert not other_board.fox_animations
+        assert not other_board.snake_animations
+
+    def test_render_redraws_after_piece_moves(self):
+        """Test that the cached board layer is redrawn once a piece moves"""
+        import pygame
+        pygame.init()
+        
+        board = Board(num_circles=6, nodes_per_circle=10)
+        screen = pygame.Surface((1800, 1000))
+        
+        # Rendering twice without changes gives the same frame
+        screen.fill((255, 255, 255))
+        board.render(screen)
+        first_frame = pygame.image.tostring(screen, 'RGB')
+        screen.fill((255, 255, 255))
+        board.render(screen)
+        assert pygame.image.tostring(screen, 'RGB') == first_frame
+        
+        # Moving a fox in place must show up in the next frame
+        fox_node = board.fox_pieces[0]
+        board.fox_pieces[0] = board.get_node(4, fox_node.node_idx)
+        screen.fill((255, 255, 255))
+        board.render(screen)
+        assert pygame.image.tostring(screen, 'RGB') != first_frame
+    
+    def test_render_keeps_what_is_under_the_board(self):
+        """Test that rendering only draws the board and not an earlier screen"""
+        import pygame
+        pygame.init()
+        
+        board = Board(num_circles=6, nodes_per_circle=10)
+        screen = pygame.Surface((1800, 1000))
+        
+        # Render once over white, then again over blue with nothing moved
+        screen.fill((255, 255, 255))
+        board.render(screen)
+        screen.fill((0, 0, 255))
+        board.render(screen)
+        
+        # A corner away from the board shows the new fill, not the old frame
+        assert screen.get_at((1, 1))[:3] == (0, 0, 255)
+        assert screen.get_at((1798, 998))[:3] == (0, 0, 255)
     
     def test_find_closest_foxes(self):
         """Test that closest foxes are found correctly"""
@@ -303,6 +357,94 @@ class TestBoard:
         # Check that a player cannot move to another player's node
         assert board.is_node_occupied(player2_node, player1_node) == True
     
+    def test_node_occupation_follows_in_place_edits(self):
+        """Test that occupation is refreshed when a piece list is edited in place"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        
+        # Query once so the occupancy is cached
+        old_fox_node = board.fox_pieces[0]
+        new_fox_node = board.get_node(3, 3)
+        assert board.is_node_occupied(old_fox_node) == True
+        assert board.is_node_occupied(new_fox_node) == False
+        
+        # Move the fox by replacing its entry in the list
+        board.fox_pieces[0] = new_fox_node
+        assert board.is_node_occupied(new_fox_node) == True
+        assert board.is_node_occupied(old_fox_node) == False
+        
+        # Appending and removing player pieces is seen as well
+        player_node = board.get_node(2, 4)
+        board.player_pieces.append(player_node)
+        assert board.is_node_occupied(player_node) == True
+        board.player_pieces.remove(player_node)
+        assert board.is_node_occupied(player_node) == False
+    
+    def test_connected_nodes_follow_piece_moves(self):
+        """Test that cached connected nodes are refreshed when a piece moves"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        board.player_pieces = []
+        board.snake_pieces = []
+        
+        # Block the outer neighbour of a node with a fox
+        node = board.get_node(2, 0)
+        fox_node = board.get_node(3, 0)
+        board.fox_pieces = [fox_node]
+        assert fox_node not in board.get_connected_nodes(node)
+        
+        # Once the fox moves away, the same query must see the free node
+        new_fox_node = board.move_fox_toward_player(fox_node, board.get_node(5, 5))
+        assert new_fox_node is not fox_node
+        assert fox_node in board.get_connected_nodes(node)
+    
+    def test_move_queries_follow_in_place_edits(self):
+        """Test that cached move queries are refreshed when a piece list is edited in place"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        board.player_pieces = []
+        board.snake_pieces = []
+        board.fox_pieces = []
+        
+        # Cache both queries with the inner neighbour free
+        node = board.get_node(2, 0)
+        inner_node = board.get_node(1, 0)
+        assert inner_node in board.get_connected_nodes(node)
+        assert inner_node in board.get_valid_moves(node, 1)
+        
+        # A snake appended to the list blocks it for both queries
+        board.snake_pieces.append(inner_node)
+        assert inner_node not in board.get_connected_nodes(node)
+        assert inner_node not in board.get_valid_moves(node, 1)
+        
+        # Moving the snake away by item assignment frees it again
+        board.snake_pieces[0] = board.get_node(4, 5)
+        assert inner_node in board.get_connected_nodes(node)
+        assert inner_node in board.get_valid_moves(node, 1)
+    
+    def test_move_queries_check_occupancy_once(self):
+        """Test that a move query compares the piece lists once rather than per node"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        comparisons = []
+        
+        class CountingList(list):
+            def __eq__(self, other):
+                comparisons.append(other)
+                return list.__eq__(self, other)
+            
+            __hash__ = None
+        
+        board.player_pieces = []
+        board.fox_pieces = CountingList([board.get_node(3, 2)])
+        board.snake_pieces = []
+        board.is_node_occupied(board.get_node(3, 2))
+        
+        # Each query is new, so it searches the board but checks occupancy once
+        comparisons.clear()
+        board.get_connected_nodes(board.get_node(3, 0))
+        assert len(comparisons) == 1
+        
+        comparisons.clear()
+        board.get_valid_moves(board.get_node(3, 0), 4)
+        assert len(comparisons) == 1
+    
     def test_valid_moves_with_occupation(self):
         """Test that valid moves exclude occupied nodes"""
         board = Board(num_circles=6, nodes_per_circle=10)
@@ -684,6 +826,13 @@ class TestPlayer:
         assert player.has_reached_outer_circle == False
         assert player.pieces == 2
         assert player.active == True
+        
+        # The interrupted move's animation state is cleared as well
+        assert player.is_moving == False
+        assert player.move_progress == 0
+        assert player.move_speed == 0.05
+        assert player.animation_path == []
+        assert player.target_node is None
     
     def test_win_condition(self):
         """Test that the win condition works correctly"""
@@ -708,6 +857,57 @@ class TestPlayer:
         # Now player should be able to win
         assert player.can_win() == True
     
+    def test_resting_position_follows_current_node(self):
+        """Test that the cached resting position is refreshed when the node changes"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        player = Player(board, player_num=1)
+        
+        # On the center node the player sits to the left of the node
+        center_x, center_y = board.center_node.get_position()
+        assert player.get_current_animated_position() == (center_x - 15, center_y)
+        
+        # Moving the player directly must not return the stale center position
+        node = board.get_node(2, 3)
+        player.current_node = node
+        assert player.get_current_animated_position() == node.get_position()
+    
+    def test_animation_paths_have_path_points(self):
+        """Test that straight and arc paths both have Player.PATH_POINTS points"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        player = Player(board)
+        
+        # Straight path out of the center
+        player.start_move_animation(board.get_node(1, 0))
+        assert len(player.animation_path) == Player.PATH_POINTS
+        
+        # Arc path along a ring
+        player.current_node = board.get_node(2, 0)
+        player.start_move_animation(board.get_node(2, 1))
+        assert len(player.animation_path) == Player.PATH_POINTS
+        
+        # Animating past the end stays on the last point
+        player.move_progress = 0.999
+        assert player.get_current_animated_position() == player.animation_path[-1]
+    
+    def test_move_speed_follows_path_length(self):
+        """Test that shorter moves animate faster than longer ones, within bounds"""
+        board = Board(num_circles=6, nodes_per_circle=10)
+        player = Player(board)
+        
+        # Short arc between neighbouring nodes on an inner ring
+        player.current_node = board.get_node(1, 0)
+        player.start_move_animation(board.get_node(1, 1))
+        short_speed = player.move_speed
+        
+        # Long arc between neighbouring nodes on the outer ring
+        player.current_node = board.get_node(5, 0)
+        player.start_move_animation(board.get_node(5, 1))
+        long_speed = player.move_speed
+        
+        assert short_speed > long_speed
+        for speed in (short_speed, long_speed):
+            assert Player.MIN_MOVE_SPEED <= speed <= Player.MAX_MOVE_SPEED
+    
     def test_lose_piece(self):
         """Test that player can lose pieces correctly"""
         board = Board(num_circles=6, nodes_per_circle=10)
@@ -910,6 +1110,27 @@ class TestDice:
         assert isinstance(values, list)
         assert len(values) == dice.num_dice
         assert all(isinstance(val, FaceType) for val in values)
+    
+    def test_dice_render_redraws_after_roll(self):
+        """Test that rendering shows new faces once the dice values change"""
+        import pygame
+        
+        dice = Dice()
+        screen = pygame.Surface((300, 200))
+        
+        # The centre of the first die shows a black pip initially
+        dice.render(screen, 0, 0)
+        center = (dice.size // 2, dice.size // 2)
+        assert screen.get_at(center)[:3] == (0, 0, 0)
+        
+        # Roll with the dice set to land on red triangles and render again
+        dice.roll()
+        dice.final_values = [FaceType.RED_TRIANGLE] * dice.num_dice
+        while dice.is_rolling:
+            dice.update()
+        dice.render(screen, 0, 0)
+        
+        assert screen.get_at(center)[:3] != (0, 0, 0)
 
 class TestGame:
     """Tests for the Game class"""
@@ -1076,10 +1297,7 @@ class TestGame:
         game.board.fox_pieces = [fox_node]  # Replace all fox pieces with just this one
         
         # Set up the game state for fox movement
-        game.foxes_to_move = [fox_node]
-        game.fox_movement_active = True
-        game.current_fox_index = 0
-        game.current_turn = "Foxes"
+        game.start_movement("Foxes", [fox_node])
         
         # Create a direct test for the center node capture logic
         # This simulates a fox landing on the center node where both players are
@@ -1119,10 +1337,7 @@ class TestGame:
         game.board.snake_pieces = [snake_node]  # Replace all snake pieces with just this one
         
         # Set up the game state for snake movement
-        game.snakes_to_move = [snake_node]
-        game.snake_movement_active = True
-        game.current_snake_index = 0
-        game.current_turn = "Snakes"
+        game.start_movement("Snakes", [snake_node])
         
         # Check initial state
         assert game.player1.active == True
@@ -1144,3 +1359,96 @@ class TestGame:
         
         # Clean up pygame
         pygame.quit()
+    
+    def test_get_node_at_position(self):
+        """Test that clicks are resolved to the node under the cursor"""
+        from game import Game
+        import pygame
+        
+        # Initialize pygame for the test
+        pygame.init()
+        
+        game = Game(num_circles=6, nodes_per_circle=10)
+        board = game.board
+        
+        # Clicks on and near each node resolve to that node
+        for circle in board.nodes:
+            for node in circle:
+                x, y = node.get_position()
+                assert game.get_node_at_position((x, y)) is node
+                assert game.get_node_at_position((x + board.node_radius - 1, y)) is node
+        
+        # Clicks away from every node resolve to nothing
+        assert game.get_node_at_position((0, 0)) is None
+        assert game.get_node_at_position((board.center_x + board.circle_spacing * 3 // 2, board.center_y)) is None
+        
+        # Clean up pygame
+        pygame.quit()
+    
+    def test_capture_on_center_reports_every_piece(self):
+        """Test that landing on the center captures and reports every player there"""
+        from game import Game
+        import pygame
+        
+        # Initialize pygame for the test
+        pygame.init()
+        
+        game = Game(num_circles=6, nodes_per_circle=10)
+        center_node = game.board.center_node
+        
+        # Place both players on the center node
+        game.player1.current_node = center_node
+        game.player2.current_node = center_node
+        game.update_player_pieces()
+        game.current_turn = "Foxes"
+        
+        # A fox lands on the center while the current player is tracked elsewhere
+        game._capture_players(center_node, game.board.get_node(2, 0))
+        
+        # Both players are captured and named in a single message
+        assert game.player1.active == False
+        assert game.player2.active == False
+        assert game.show_capture_message == True
+        assert game.capture_message == "Foxes captured Player 1's and Player 2's pieces on the center!"
+        
+        # A single player on the center is named on its own
+        game.reset_game()
+        game.player1.current_node = center_node
+        game.player2.current_node = game.board.get_node(3, 0)
+        game.update_player_pieces()
+        game.current_turn = "Foxes"
+        game._capture_players(center_node, game.board.get_node(2, 0))
+        assert game.capture_message == "Foxes captured Player 1's piece on the center!"
+        
+        # Clean up pygame
+        pygame.quit()
+    
+    def test_fox_turn_delay_does_not_redraw(self):
+        """Test that waiting between fox moves does not mark the screen dirty"""
+        from game import Game
+        import pygame
+        
+        # Initialize pygame for the test
+        pygame.init()
+        
+        game = Game(num_circles=6, nodes_per_circle=10)
+        game.mode_selection_active = False
+        
+        # Starting the foxes' turn changes the screen
+        game.dirty = False
+        game.start_movement("Foxes", list(game.board.fox_pieces[:1]))
+        assert game.dirty == True
+        
+        # Frames spent waiting for the first fox leave the screen alone
+        game.dirty = False
+        for _ in range(game.movement_delay - 1):
+            game.update()
+        assert game.is_animating() == True
+        assert game.dirty == False
+        
+        # The fox moves once the delay is over
+        game.update()
+        assert game.dirty == True
+        
+        # Clean up pygame
+        pygame.quit()
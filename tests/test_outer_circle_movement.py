@@ -95,8 +95,7 @@ class TestOuterCircleMovement:
 
     def test_game_environment_outer_circle_movement(self):
         """Test movement to the outer circle in a simulated game environment"""
-        # Create a game instance with a dummy surface
-        screen = pygame.Surface((1800, 1000))
+        # Create a game instance
         game = Game()
         
         # Disable mode selection for the test
@@ -256,7 +255,6 @@ class TestOuterCircleMovement:
     def test_outer_circle_node_after_game_update(self):
         """Test that player remains in outer circle after game updates"""
         # Create a game instance
-        screen = pygame.Surface((1800, 1000))
         game = Game()
         
         # Disable mode selection
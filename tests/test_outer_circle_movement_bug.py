@@ -83,19 +83,22 @@ class TestOuterCircleMovementBug:
         assert self.player.current_node.circle_idx == 5, "Player did not move to the outermost circle"
     
     def test_node_equality_implementation(self):
-        """Test that node equality is implemented correctly"""
-        # Create two nodes with the same coordinates
-        node1 = BoardNode(100, 100, 5, 0)
-        node2 = BoardNode(100, 100, 5, 0)
-        
-        # They should be equal
-        assert node1 == node2, "Nodes with same coordinates should be equal"
-        
-        # Create a node with different coordinates
-        node3 = BoardNode(200, 200, 5, 1)
-        
-        # They should not be equal
-        assert node1 != node3, "Nodes with different coordinates should not be equal"
+        """Test that node equality is identity based on canonical board nodes"""
+        # The board hands out the same object for the same position
+        node1 = self.board.get_node(5, 0)
+        node2 = self.board.get_node(5, 10)  # Wraps around to node 0
+        
+        # They should be the same node
+        assert node1 is node2, "The board should return the canonical node for a position"
+        assert node1 == node2, "Canonical nodes should be equal to themselves"
+        
+        # Nodes built outside the board are distinct objects, even with the same coordinates
+        node3 = BoardNode(node1.x, node1.y, 5, 0)
+        assert node1 != node3, "Equality should be identity based"
+        
+        # A node at a different position is not equal
+        node4 = self.board.get_node(5, 1)
+        assert node1 != node4, "Nodes with different coordinates should not be equal"
     
     def test_reset_to_current_position_bug(self):
         """Test the bug where player selects an outside circle node but position resets"""
@@ -166,7 +169,6 @@ class TestOuterCircleMovementBug:
         """Test movement to the outer circle in a simulated game environment"""
         # Create a game instance
         pygame.init()
-        screen = pygame.Surface((1800, 1000))  # Create a dummy surface
         game = Game()
         
         # Disable mode selection for the test